@@ -9,6 +9,7 @@ from pyskoob.http.client import AsyncHTTPClient, SyncHTTPClient
 from pyskoob.internal.async_base import AsyncBaseSkoobService
 from pyskoob.internal.base import BaseSkoobService
 from pyskoob.models.user import User
+from pyskoob.utils.fast_json import response_json
 from pyskoob.utils.sync_async import maybe_await, run_sync
 
 logger = logging.getLogger(__name__)
@@ -79,7 +80,7 @@ class _AuthServiceMixin:
         response = await maybe_await(self.client.post, url, data=data)
         response.raise_for_status()
         try:
-            json_data = response.json()
+            json_data = response_json(response)
         except ValueError as exc:
             logger.error("Login response was not valid JSON")
             raise ConnectionError("Invalid response format") from exc
@@ -109,7 +110,7 @@ class _AuthServiceMixin:
         url = f"{self.base_url}/v1/user/stats:true"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        json_data = response.json()
+        json_data = response_json(response)
         if not json_data.get("success"):
             logger.error("Failed to retrieve user information. The session token might be invalid.")
             raise ConnectionError("Failed to retrieve user information. The session token might be invalid.")
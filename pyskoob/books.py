@@ -1,7 +1,6 @@
 """Services for searching and retrieving books from Skoob."""
 
 import logging
-import re
 from collections.abc import Callable
 from typing import Any
 
@@ -14,18 +13,20 @@ from pyskoob.internal.base import BaseSkoobService
 from pyskoob.models.book import Book, BookReview, BookSearchResult
 from pyskoob.models.enums import BookSearch, BookUserStatus
 from pyskoob.models.pagination import Pagination
+from pyskoob.parsers import _lxml_backend as lxml_parser
+from pyskoob.parsers import _selectolax_backend as fast_parser
 from pyskoob.parsers.books import (
     clean_book_json_data,
     extract_edition_id_from_reviews_page,
     extract_total_results,
-    extract_user_ids_from_html,
-    parse_review,
+    iter_reviews,
     parse_search_result,
 )
 from pyskoob.utils.bs4_utils import (
     safe_find,
-    safe_find_all,
+    safe_iter_all,
 )
+from pyskoob.utils.fast_json import response_json
 from pyskoob.utils.sync_async import maybe_await, run_sync
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,27 @@ class _BookServiceMixin:
     client: Any
     base_url: str
     parse_html: Callable[[str], Any]
+    run_parser: Callable[..., Any]
+
+    def _parse_search_page(self, html: str) -> tuple[list[BookSearchResult], int]:
+        """Parse a search page into its results and the reported total."""
+
+        if fast_parser.fast_parser_enabled():
+            return fast_parser.parse_search_page(html, self.base_url)
+        soup = self.parse_html(html)
+        results = [parse_search_result(book_div, self.base_url) for book_div in safe_iter_all(soup, "div", "box_lista_busca_vertical")]
+        return [i for i in results if i], extract_total_results(soup)
+
+    def _parse_reviews_page(self, html: str, book_id: int, edition_id: int | None) -> tuple[list[BookReview], int | None, bool]:
+        """Parse a reviews page into reviews, the edition ID and the next-page flag."""
+
+        if fast_parser.fast_parser_enabled():
+            return fast_parser.parse_reviews_page(html, book_id, edition_id)
+        soup = self.parse_html(html)
+        if edition_id is None:
+            edition_id = extract_edition_id_from_reviews_page(soup)
+        has_next_page = safe_find(soup, "a", {"class": "proximo"}) is not None
+        return list(iter_reviews(soup, book_id, edition_id)), edition_id, has_next_page
 
     async def _search(
         self,
@@ -72,14 +94,8 @@ class _BookServiceMixin:
             raise RequestError("Failed to search books.") from e
 
         try:
-            soup = self.parse_html(response.text)
             limit = 30
-            results = [
-                parse_search_result(book_div, self.base_url)
-                for book_div in safe_find_all(soup, "div", {"class": "box_lista_busca_vertical"})
-            ]
-            cleaned_results: list[BookSearchResult] = [i for i in results if i]
-            total_results = extract_total_results(soup)
+            cleaned_results, total_results = await maybe_await(self.run_parser, self._parse_search_page, response.text)
             next_page_link = True if page * limit < total_results else False
         except (AttributeError, ValueError, IndexError, TypeError) as e:  # pragma: no cover - defensive
             logger.error("Failed to parse book search results: %s", e, exc_info=True)
@@ -90,11 +106,11 @@ class _BookServiceMixin:
 
         logger.info(
             "Found %s books on page %s, total %s results.",
-            len(results),
+            len(cleaned_results),
             page,
             total_results,
         )
-        return Pagination[BookSearchResult](
+        return Pagination(
             results=cleaned_results,
             limit=30,
             page=page,
@@ -131,7 +147,7 @@ class _BookServiceMixin:
             raise RequestError(f"Failed to retrieve book for edition_id {edition_id}.") from e
 
         try:
-            data = response.json()
+            data = response_json(response)
             json_data = data.get("response")
             if not json_data:
                 cod_description = data.get("cod_description", "No description provided.")
@@ -183,15 +199,9 @@ class _BookServiceMixin:
         try:
             response = await maybe_await(self.client.get, url)
             response.raise_for_status()
-            soup = self.parse_html(response.text)
-            if edition_id is None:
-                edition_id = extract_edition_id_from_reviews_page(soup)
-            book_reviews = [
-                review
-                for review in (parse_review(r, book_id, edition_id) for r in safe_find_all(soup, "div", {"id": re.compile(r"resenha\d+")}))
-                if review is not None
-            ]
-            next_page_link = safe_find(soup, "a", {"class": "proximo"})
+            book_reviews, edition_id, has_next_page = await maybe_await(
+                self.run_parser, self._parse_reviews_page, response.text, book_id, edition_id
+            )
         except (AttributeError, ValueError, IndexError, TypeError) as e:  # pragma: no cover - defensive
             logger.error("Failed to parse book reviews: %s", e, exc_info=True)
             raise ParsingError("Failed to parse book reviews.") from e
@@ -203,12 +213,12 @@ class _BookServiceMixin:
             )
             raise ParsingError("An unexpected error occurred during review fetching.") from e
         logger.info("Found %s reviews on page %s.", len(book_reviews), page)
-        return Pagination[BookReview](
+        return Pagination(
             results=book_reviews,
             limit=50,
             page=page,
             total=len(book_reviews),
-            has_next_page=next_page_link is not None,
+            has_next_page=has_next_page,
         )
 
     async def _get_users_by_status(
@@ -252,9 +262,8 @@ class _BookServiceMixin:
         try:
             response = await maybe_await(self.client.get, url)
             response.raise_for_status()
-            soup = self.parse_html(response.text)
-            users_id = extract_user_ids_from_html(soup)
-            next_page_link = safe_find(soup, "a", {"class": "proximo"})
+            backend = fast_parser if fast_parser.fast_parser_enabled() else lxml_parser
+            users_id, has_next_page = await maybe_await(self.run_parser, backend.parse_readers_page, response.text)
         except (AttributeError, ValueError, IndexError, TypeError) as e:  # pragma: no cover - defensive
             logger.error("Failed to parse users by status: %s", e, exc_info=True)
             raise ParsingError("Failed to parse users by status.") from e
@@ -270,12 +279,12 @@ class _BookServiceMixin:
             len(users_id),
             page,
         )
-        return Pagination[int](
+        return Pagination(
             results=users_id,
             limit=limit,
             page=page,
             total=len(users_id),
-            has_next_page=next_page_link is not None,
+            has_next_page=has_next_page,
         )
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 """httpx-based implementations of the HTTP client protocols."""
 
 from collections.abc import MutableMapping
+from importlib.util import find_spec
 from types import TracebackType
 from typing import Any
 
@@ -11,6 +12,25 @@ import httpx
 from ..utils import RateLimiter, Retry
 from .client import AsyncHTTPClient, HTTPResponse, SyncHTTPClient
 
+HAS_HTTP2 = find_spec("h2") is not None
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=30.0)
+"""Connection pool limits applied when the caller does not pass ``limits``.
+
+The keep-alive expiry is longer than httpx's default so that connections
+survive the pauses introduced by the rate limiter and TLS handshakes are
+amortised across a whole session.
+"""
+
+
+def _connection_defaults(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Fill in pooling and HTTP/2 defaults without overriding caller options."""
+
+    kwargs.setdefault("limits", DEFAULT_LIMITS)
+    if HAS_HTTP2:
+        kwargs.setdefault("http2", True)
+    return kwargs
+
 
 class HttpxSyncClient(SyncHTTPClient):
     """Synchronous HTTP client built on :class:`httpx.Client`.
@@ -25,7 +45,9 @@ class HttpxSyncClient(SyncHTTPClient):
         errors. If not provided a default configuration retrying up to three
         times with exponential backoff is used.
     **kwargs:
-        Additional arguments passed directly to ``httpx.Client``.
+        Additional arguments passed directly to ``httpx.Client``. Unless
+        overridden, connections are pooled with :data:`DEFAULT_LIMITS` and
+        HTTP/2 is enabled when the ``h2`` package is installed.
     """
 
     def __init__(
@@ -34,7 +56,7 @@ class HttpxSyncClient(SyncHTTPClient):
         retry: Retry | None = None,
         **kwargs: Any,
     ) -> None:
-        self._client = httpx.Client(**kwargs)
+        self._client = httpx.Client(**_connection_defaults(kwargs))
         self._rate_limiter = rate_limiter or RateLimiter()
         self._retry = retry or Retry(exceptions=(httpx.TransportError,))
 
@@ -93,7 +115,9 @@ class HttpxAsyncClient(AsyncHTTPClient):
         errors. If not provided a default configuration retrying up to three
         times with exponential backoff is used.
     **kwargs:
-        Additional arguments passed directly to ``httpx.AsyncClient``.
+        Additional arguments passed directly to ``httpx.AsyncClient``. Unless
+        overridden, connections are pooled with :data:`DEFAULT_LIMITS` and
+        HTTP/2 is enabled when the ``h2`` package is installed.
     """
 
     def __init__(
@@ -102,7 +126,7 @@ class HttpxAsyncClient(AsyncHTTPClient):
         retry: Retry | None = None,
         **kwargs: Any,
     ) -> None:
-        self._client = httpx.AsyncClient(**kwargs)
+        self._client = httpx.AsyncClient(**_connection_defaults(kwargs))
         self._rate_limiter = rate_limiter or RateLimiter()
         self._retry = retry or Retry(exceptions=(httpx.TransportError,))
 
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 """Base classes for asynchronous Skoob HTTP services."""
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any, TypeVar
+
 from bs4 import BeautifulSoup
 
 from pyskoob.http.client import AsyncHTTPClient
 from pyskoob.http.httpx import HttpxAsyncClient
+from pyskoob.utils.bs4_utils import parse_html
+
+T = TypeVar("T")
 
 
 class AsyncBaseHttpService:  # pragma: no cover - thin async base
@@ -13,6 +21,9 @@ class AsyncBaseHttpService:  # pragma: no cover - thin async base
 
     _base_url: str
 
+    parse_executor: Executor | None = None
+    """Executor used by :meth:`run_parser`; ``None`` selects the loop's default thread pool."""
+
     def __init__(self, client: AsyncHTTPClient, base_url: str) -> None:
         self._client = client
         self._base_url = base_url
@@ -29,7 +40,17 @@ class AsyncBaseHttpService:  # pragma: no cover - thin async base
 
     def parse_html(self, content: str) -> BeautifulSoup:
         """Parse HTML content into a :class:`BeautifulSoup` object."""
-        return BeautifulSoup(content, "html.parser")
+        return parse_html(content)
+
+    async def run_parser(self, func: Callable[..., T], /, *args: Any) -> T:
+        """Run a CPU-bound page parser in :attr:`parse_executor`.
+
+        Parsing a listing page takes milliseconds of pure CPU work; running
+        it in an executor keeps the event loop free to drive other requests
+        in the meantime.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor, func, *args)
 
 
 class AsyncBaseSkoobService(AsyncBaseHttpService):  # pragma: no cover - thin async base
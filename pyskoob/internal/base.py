@@ -1,9 +1,15 @@
 """Base classes for synchronous Skoob HTTP services."""
 
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 from bs4 import BeautifulSoup
 
 from pyskoob.http.client import SyncHTTPClient
 from pyskoob.http.httpx import HttpxSyncClient
+from pyskoob.utils.bs4_utils import parse_html
+
+T = TypeVar("T")
 
 
 class BaseHttpService:
@@ -77,7 +83,28 @@ class BaseHttpService:
         >>> service.parse_html("<html></html>").name
         '[document]'
         """
-        return BeautifulSoup(content, "html.parser")
+        return parse_html(content)
+
+    def run_parser(self, func: Callable[..., T], /, *args: Any) -> T:
+        """
+        Runs a page parser.
+
+        Synchronous services parse inline; the asynchronous base class
+        overrides this to move the work off the event loop.
+
+        Parameters
+        ----------
+        func : Callable[..., T]
+            Parser to call.
+        *args : Any
+            Positional arguments forwarded to ``func``.
+
+        Returns
+        -------
+        T
+            The parser's result.
+        """
+        return func(*args)
 
 
 class BaseSkoobService(BaseHttpService):
@@ -0,0 +1,352 @@
+"""lxml/XPath parsers for the paginated listing pages.
+
+The book reader, publisher book and author, and user relation and review
+listings are fetched many pages at a time, so their parsers query the C-level
+``lxml`` tree with XPath instead of building a BeautifulSoup tree per page.
+The publisher and user parsers also accept the undecoded response body (see
+:func:`response_markup`), and the user parsers skip pages that cannot hold an
+entry or a next-page link without building a tree at all.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+
+from lxml import etree
+
+from pyskoob.http.client import HTTPResponse
+from pyskoob.models.book import BookReview
+from pyskoob.models.publisher import PublisherAuthor, PublisherItem
+from pyskoob.parsers.books import parse_review_date
+from pyskoob.parsers.users import NEXT_REVIEWS_PAGE_TEXT
+from pyskoob.utils.skoob_parser_utils import get_book_edition_id_from_url, get_book_id_from_url, get_user_id_from_url
+
+logger = logging.getLogger(__name__)
+
+_USER_ID_RE = re.compile(r"/usuario/(\d+)")
+_REVIEW_ID_RE = re.compile(r"resenha\d+")
+_REVIEW_COMMENT_ID_RE = re.compile(r"resenhac\d+")
+_REVIEW_BOOK_HREF_RE = re.compile(r".*\d+ed\d+.html")
+
+
+def _has_class(name: str) -> str:
+    """Return an XPath predicate matching elements with CSS class ``name``."""
+
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_READER_HREFS = etree.XPath(f"//div[{_has_class('livro-leitor-container')}]/descendant::a[1]/@href")
+_NEXT_PAGE = etree.XPath(f"boolean(//a[{_has_class('proximo')}])")
+_PUBLISHER_BOOKS = etree.XPath(f"//div[{_has_class('box_livro')}]")
+_PUBLISHER_AUTHORS = etree.XPath(f"//div[{_has_class('box_autor')}]")
+_NEXT_PAGE_DIV = etree.XPath(f"boolean(//div[{_has_class('proximo')}])")
+_USER_RELATIONS = etree.XPath(f"//div[{_has_class('usuarios-mini-lista-txt')}]")
+_USER_REVIEWS = etree.XPath("//div[contains(@id, 'resenha')]")
+_NEXT_REVIEWS_PAGE_CANDIDATES = etree.XPath("//a[contains(., $text)]")
+# Text nodes BeautifulSoup's ``get_text`` reports: comments are not text
+# nodes, and script and style contents are skipped.
+_STRINGS = etree.XPath("descendant::text()[not(parent::script) and not(parent::style)]")
+
+
+def parse_readers_page(html: str) -> tuple[list[int], bool]:
+    """Parse a book readers page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the ``/livro/leitores`` page.
+
+    Returns
+    -------
+    tuple of (list of int, bool)
+        User identifiers in page order and whether a next page exists.
+    """
+
+    root = etree.HTML(html)
+    if root is None:
+        return [], False
+    id_strings: list[str] = []
+    for href in _READER_HREFS(root):
+        match = _USER_ID_RE.search(href)
+        if match:
+            id_strings.append(match.group(1))
+        else:
+            logger.warning("Could not extract user ID from URL: %s", href)
+    return list(map(int, id_strings)), bool(_NEXT_PAGE(root))
+
+
+def response_markup(response: HTTPResponse) -> tuple[str | bytes, str | None]:
+    """Return the body of ``response`` in the form lxml parses fastest.
+
+    When the response exposes its raw ``content`` and ``encoding`` (as
+    :class:`httpx.Response` does) the undecoded bytes are returned together
+    with the encoding, so lxml decodes them while parsing instead of the body
+    being decoded to ``str`` first. Other responses fall back to ``text``.
+
+    Parameters
+    ----------
+    response : HTTPResponse
+        Response of a page request.
+
+    Returns
+    -------
+    tuple of (str or bytes, str or None)
+        The page markup and, for bytes, the encoding to decode it with.
+    """
+
+    content = getattr(response, "content", None)
+    encoding = getattr(response, "encoding", None)
+    if isinstance(content, bytes) and isinstance(encoding, str):
+        return content, encoding
+    return response.text, None
+
+
+def _mentions(html: str | bytes, *needles: str) -> bool:
+    """Return ``True`` if any ASCII ``needle`` occurs in the raw ``html``.
+
+    A substring search over the undecoded body is far cheaper than building
+    a tree, so pages that cannot hold any entry skip parsing altogether.
+    """
+
+    if isinstance(html, bytes):
+        return any(needle.encode("ascii") in html for needle in needles)
+    return any(needle in html for needle in needles)
+
+
+def _html_root(html: str | bytes, encoding: str | None) -> etree._Element | None:
+    """Parse ``html`` into an lxml tree, decoding bytes with ``encoding``."""
+
+    if isinstance(html, bytes):
+        encoding = encoding or "utf-8"
+        try:
+            # Without an explicit encoding libxml2 falls back to Latin-1 for
+            # pages lacking a charset declaration.
+            parser = etree.HTMLParser(encoding=encoding)
+        except LookupError:
+            # Python codec alias libxml2 does not know (e.g. "latin-1").
+            return etree.HTML(html.decode(encoding, errors="replace"))
+        return etree.HTML(html, parser)
+    return etree.HTML(html)
+
+
+def _first(element: etree._Element, tag: str) -> etree._Element | None:
+    """Return the first descendant of ``element`` named ``tag``.
+
+    Walking ``iter`` lazily is cheaper per entry than evaluating an XPath
+    expression, which has to set up its own evaluation context on each call.
+    """
+
+    return next(element.iter(tag), None)
+
+
+def _anchor_and_img(div: etree._Element) -> tuple[etree._Element | None, str]:
+    """Return the first link in ``div`` and the ``src`` of its first image."""
+
+    anchor = _first(div, "a")
+    if anchor is None:
+        return None, ""
+    img = _first(anchor, "img")
+    return anchor, img.get("src", "") if img is not None else ""
+
+
+def parse_publisher_books_page(html: str | bytes, base_url: str, encoding: str | None = None) -> tuple[list[PublisherItem], bool]:
+    """Parse a publisher books page.
+
+    Mirrors :func:`pyskoob.parsers.publishers.parse_book` for every
+    ``div.box_livro`` block; a missing title or cover becomes ``""`` and
+    blocks without a link are skipped.
+
+    Parameters
+    ----------
+    html : str or bytes
+        Raw HTML of the ``/editora/livros`` page.
+    base_url : str
+        Base URL used to expand the book links.
+    encoding : str or None, optional
+        Encoding of ``html`` when it is bytes, by default UTF-8.
+
+    Returns
+    -------
+    tuple of (list of PublisherItem, bool)
+        Books in page order and whether a next page exists.
+    """
+
+    root = _html_root(html, encoding)
+    if root is None:
+        return [], False
+    books: list[PublisherItem] = []
+    for div in _PUBLISHER_BOOKS(root):
+        anchor, img_url = _anchor_and_img(div)
+        href = anchor.get("href") if anchor is not None else None
+        if anchor is None or not href:
+            logger.warning("Skipping publisher book without a link.")
+            continue
+        books.append(PublisherItem(url=f"{base_url}{href}", title=anchor.get("title", ""), img_url=img_url))
+    return books, bool(_NEXT_PAGE_DIV(root))
+
+
+def parse_publisher_authors_page(html: str | bytes, base_url: str, encoding: str | None = None) -> tuple[list[PublisherAuthor], bool]:
+    """Parse a publisher authors page.
+
+    Every ``div.box_autor`` block yields its link, ``h3`` name and cover;
+    a missing cover becomes ``""`` and blocks without a link are skipped.
+
+    Parameters
+    ----------
+    html : str or bytes
+        Raw HTML of the ``/editora/autores`` page.
+    base_url : str
+        Base URL used to expand the author links.
+    encoding : str or None, optional
+        Encoding of ``html`` when it is bytes, by default UTF-8.
+
+    Returns
+    -------
+    tuple of (list of PublisherAuthor, bool)
+        Authors in page order and whether a next page exists.
+    """
+
+    root = _html_root(html, encoding)
+    if root is None:
+        return [], False
+    authors: list[PublisherAuthor] = []
+    for div in _PUBLISHER_AUTHORS(root):
+        anchor, img_url = _anchor_and_img(div)
+        href = anchor.get("href") if anchor is not None else None
+        if not href:
+            logger.warning("Skipping publisher author without a link.")
+            continue
+        heading = _first(div, "h3")
+        name = "".join(text.strip() for text in heading.itertext()) if heading is not None else ""
+        authors.append(PublisherAuthor(url=f"{base_url}{href}", name=name, img_url=img_url))
+    return authors, bool(_NEXT_PAGE_DIV(root))
+
+
+def _strings(element: etree._Element) -> list[str]:
+    """Return the stripped, non-empty strings inside ``element``."""
+
+    return [text for string in _STRINGS(element) if (text := string.strip())]
+
+
+def _string(element: etree._Element) -> str | None:
+    """Mirror BeautifulSoup's ``Tag.string`` for ``element``."""
+
+    children = list(element)
+    if not children:
+        return element.text
+    if len(children) == 1 and not element.text and not children[0].tail and isinstance(children[0].tag, str):
+        return _string(children[0])
+    return None
+
+
+def _review_text(comment: etree._Element, span: etree._Element, date_strings: list[str]) -> str:
+    """Return the text that follows the date ``span`` in a review comment.
+
+    Strings are joined with newlines, like the book review parser does. The
+    block is flattened once and the date prefix, given as the already
+    collected ``date_strings`` of ``span``, removed; only when the span is
+    nested, or preceded by other text, are its following siblings flattened
+    one by one.
+    """
+
+    text = "\n".join(_strings(comment))
+    date_text = "\n".join(date_strings)
+    if span.getparent() is comment and text.startswith(date_text):
+        return text[len(date_text) :].lstrip("\n")
+    parts = [span.tail.strip()] if span.tail else []
+    for sibling in span.itersiblings():
+        if isinstance(sibling.tag, str):
+            parts.append("\n".join(_strings(sibling)))
+        if sibling.tail:
+            parts.append(sibling.tail.strip())
+    return "\n".join(filter(None, parts))
+
+
+def _descendant_matching(element: etree._Element, tag: str, attr: str, pattern: re.Pattern[str]) -> etree._Element | None:
+    """Return the first ``tag`` descendant whose ``attr`` matches ``pattern``."""
+
+    return next((child for child in element.iterdescendants(tag) if pattern.search(child.get(attr) or "")), None)
+
+
+def parse_user_relations_page(html: str | bytes, encoding: str | None = None) -> tuple[list[int], bool]:
+    """Parse a user relations (friends, followers or following) page.
+
+    Parameters
+    ----------
+    html : str or bytes
+        Markup of the relation listing page.
+    encoding : str or None, optional
+        Encoding of ``html`` when it is bytes, by default UTF-8.
+
+    Returns
+    -------
+    tuple of (list of int, bool)
+        Related user identifiers in page order and whether a next page exists.
+    """
+
+    if not _mentions(html, "usuarios-mini-lista-txt", "proximo"):
+        return [], False
+    root = _html_root(html, encoding)
+    if root is None:
+        return [], False
+    users_id: list[int] = []
+    for user_div in _USER_RELATIONS(root):
+        anchor = _first(user_div, "a")
+        if anchor is not None:
+            users_id.append(int(get_user_id_from_url(anchor.get("href", ""))))
+    return users_id, bool(_NEXT_PAGE_DIV(root))
+
+
+def parse_user_reviews_page(html: str | bytes, user_id: int, encoding: str | None = None) -> tuple[list[BookReview], bool]:
+    """Parse the reviews written by a user.
+
+    Parameters
+    ----------
+    html : str or bytes
+        Raw HTML of the ``/estante/resenhas`` page.
+    user_id : int
+        Identifier of the review author.
+    encoding : str or None, optional
+        Encoding of ``html`` when it is bytes, by default UTF-8.
+
+    Returns
+    -------
+    tuple of (list of BookReview, bool)
+        Parsed reviews and whether a next page exists.
+    """
+
+    # "xima" is the ASCII tail of the "Próxima" next-page link text.
+    if not _mentions(html, "resenha", "xima"):
+        return [], False
+    root = _html_root(html, encoding)
+    if root is None:
+        return [], False
+    reviews = [
+        _parse_user_review(review_div, user_id) for review_div in _USER_REVIEWS(root) if _REVIEW_ID_RE.search(review_div.get("id", ""))
+    ]
+    has_next_page = any(
+        _string(link) == NEXT_REVIEWS_PAGE_TEXT for link in _NEXT_REVIEWS_PAGE_CANDIDATES(root, text=NEXT_REVIEWS_PAGE_TEXT.strip())
+    )
+    return reviews, has_next_page
+
+
+def _parse_user_review(review_div: etree._Element, user_id: int) -> BookReview:
+    """Build a :class:`BookReview` from one ``resenha<n>`` block."""
+
+    book_anchor = _descendant_matching(review_div, "a", "href", _REVIEW_BOOK_HREF_RE)
+    book_url = book_anchor.get("href", "") if book_anchor is not None else ""
+    star_rating = _first(review_div, "star-rating")
+    comment = _descendant_matching(review_div, "div", "id", _REVIEW_COMMENT_ID_RE)
+    span = _first(comment, "span") if comment is not None else None
+    # The date strings feed both the date and the review text prefix.
+    date_strings = _strings(span) if span is not None else []
+    return BookReview(
+        review_id=int(review_div.get("id", "").replace("resenha", "")),
+        book_id=int(get_book_id_from_url(book_url)),
+        edition_id=int(get_book_edition_id_from_url(book_url)),
+        user_id=user_id,
+        rating=float(star_rating.get("rate", "0") if star_rating is not None else "0"),
+        review_text=_review_text(comment, span, date_strings) if comment is not None and span is not None else "",
+        reviewed_at=parse_review_date("".join(date_strings)),
+    )
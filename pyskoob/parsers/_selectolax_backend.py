@@ -0,0 +1,398 @@
+"""Optional selectolax-backed parsers for list-heavy Skoob pages.
+
+``selectolax`` wraps the Lexbor HTML engine, so parsing, CSS selection and
+text extraction run in C instead of walking a BeautifulSoup tree in Python.
+The helpers in this module mirror the BeautifulSoup implementations in
+:mod:`pyskoob.parsers.books` and the user service, and return the same
+models.
+
+The backend is opt-in: install the ``fast`` extra and set the
+``PYSKOOB_FAST_PARSER`` environment variable to ``1``. Without both, the
+services keep using BeautifulSoup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from typing import TYPE_CHECKING
+
+from pyskoob.models.book import BookReview, BookSearchResult
+from pyskoob.models.user import UserSearch
+from pyskoob.parsers.books import (
+    normalize_img_url,
+    parse_rating,
+    parse_review_date,
+    parse_total_results,
+    split_publisher_and_isbn,
+)
+from pyskoob.parsers.users import NEXT_REVIEWS_PAGE_TEXT, parse_user_search_total
+from pyskoob.utils.skoob_parser_utils import (
+    get_book_edition_id_from_url,
+    get_book_id_from_url,
+    get_user_id_from_url,
+)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_SELECTOLAX = False
+else:
+    HAS_SELECTOLAX = True
+
+if TYPE_CHECKING:
+    from selectolax.lexbor import LexborNode
+
+logger = logging.getLogger(__name__)
+
+FAST_PARSER_ENV = "PYSKOOB_FAST_PARSER"
+
+_USER_ID_RE = re.compile(r"/usuario/(\d+)")
+_REVIEW_ID_RE = re.compile(r"resenha\d+")
+_REVIEW_COMMENT_ID_RE = re.compile(r"resenhac\d+")
+_REVIEW_BOOK_HREF_RE = re.compile(r".*\d+ed\d+.html")
+_USER_HREF_RE = re.compile(r"^/usuario/\d+-")
+_USER_HREF_PARTS_RE = re.compile(r"/usuario/(\d+)-([\w\.\-]+)")
+_SEARCH_RESULT_STYLE = "border: 1px solid #e4e4e4"
+_NON_TEXT_TAGS = frozenset({"script", "style"})
+
+
+def fast_parser_enabled() -> bool:
+    """Return ``True`` when the selectolax backend should be used.
+
+    Returns
+    -------
+    bool
+        ``True`` if ``selectolax`` is importable and the
+        ``PYSKOOB_FAST_PARSER`` environment variable is set to ``1``.
+    """
+
+    return HAS_SELECTOLAX and os.environ.get(FAST_PARSER_ENV) == "1"
+
+
+def _text(node: LexborNode | None, separator: str = "") -> str:
+    """Mirror BeautifulSoup's ``get_text(separator, strip=True)``.
+
+    Lexbor keeps whitespace-only text nodes as empty entries when stripping,
+    so strings are collected manually to produce identical output. Like
+    BeautifulSoup and the lxml backend, the contents of ``script`` and
+    ``style`` elements are not text.
+    """
+
+    if node is None or node.tag in _NON_TEXT_TAGS:
+        return ""
+    if node.is_text_node:
+        return (node.text_content or "").strip()
+    return separator.join(
+        stripped
+        for child in node.traverse(include_text=True)
+        if child.is_text_node
+        and (stripped := (child.text_content or "").strip())
+        and (child.parent is None or child.parent.tag not in _NON_TEXT_TAGS)
+    )
+
+
+def parse_readers_page(html: str) -> tuple[list[int], bool]:
+    """Parse a book readers page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the ``/livro/leitores`` page.
+
+    Returns
+    -------
+    tuple of (list of int, bool)
+        User identifiers in page order and whether a next page exists.
+    """
+
+    tree = LexborHTMLParser(html)
+    id_strings: list[str] = []
+    for user_div in tree.css("div.livro-leitor-container"):
+        user_link = user_div.css_first("a")
+        href = user_link.attributes.get("href") if user_link is not None else None
+        if not href:
+            logger.warning("Skipping user_div due to missing 'a' tag or href attribute.")
+            continue
+        match = _USER_ID_RE.search(href)
+        if match:
+            id_strings.append(match.group(1))
+        else:
+            logger.warning("Could not extract user ID from URL: %s", href)
+    return list(map(int, id_strings)), tree.css_first("a.proximo") is not None
+
+
+def parse_search_page(html: str, base_url: str) -> tuple[list[BookSearchResult], int]:
+    """Parse a book search page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the search page.
+    base_url : str
+        Base URL used to expand relative links.
+
+    Returns
+    -------
+    tuple of (list of BookSearchResult, int)
+        Parsed results and the total number of matches reported by the page.
+    """
+
+    tree = LexborHTMLParser(html)
+    results: list[BookSearchResult] = []
+    for book_div in tree.css("div.box_lista_busca_vertical"):
+        result = _parse_search_result(book_div, base_url)
+        if result is not None:
+            results.append(result)
+    return results, parse_total_results(_text(tree.css_first("div.contador")))
+
+
+def _parse_search_result(book_div: LexborNode, base_url: str) -> BookSearchResult | None:
+    """selectolax counterpart of :func:`pyskoob.parsers.books.parse_search_result`."""
+
+    container = book_div.css_first("a.capa-link-item")
+    if container is None:
+        logger.warning("Skipping book_div due to missing 'capa-link-item' container.")  # pragma: no cover
+        return None
+    attrs = container.attributes
+    title = attrs.get("title") or ""
+    book_url = f"{base_url}{attrs.get('href')}"
+    img = container.css_first("img")
+    img_url = normalize_img_url(img.attributes.get("src") or "") if img is not None else ""
+    try:
+        book_id = int(get_book_id_from_url(book_url))
+        edition_id = int(get_book_edition_id_from_url(book_url))
+    except (ValueError, TypeError):  # pragma: no cover - defensive
+        logger.warning("Skipping book_div due to invalid book/edition id in url: %s", book_url)
+        return None
+    texts: list[str] = []
+    details = book_div.css_first("div.detalhes-2-sub")
+    details_div = details.css_first("div") if details is not None else None
+    if details_div is not None:
+        texts = [text for span in details_div.css("span") if (text := _text(span)) and text != "|"]
+    publisher, isbn = split_publisher_and_isbn(texts)
+    star_mini = book_div.css_first("div.star-mini")
+    rating = parse_rating(_text(star_mini.css_first("strong")), title) if star_mini is not None else None
+    return BookSearchResult(
+        edition_id=edition_id,
+        book_id=book_id,
+        title=title,
+        publisher=publisher,
+        isbn=isbn,
+        url=book_url,
+        cover_url=img_url,
+        rating=rating,
+    )
+
+
+def parse_reviews_page(html: str, book_id: int, edition_id: int | None) -> tuple[list[BookReview], int | None, bool]:
+    """Parse a book reviews page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the reviews page.
+    book_id : int
+        Identifier of the reviewed book.
+    edition_id : int or None
+        Edition identifier. When ``None`` it is read from the page menu.
+
+    Returns
+    -------
+    tuple of (list of BookReview, int or None, bool)
+        Parsed reviews, the edition identifier and whether a next page exists.
+    """
+
+    tree = LexborHTMLParser(html)
+    if edition_id is None:
+        menu_link = tree.css_first("div#pg-livro-menu-principal-container a")
+        href = menu_link.attributes.get("href") if menu_link is not None else None
+        if href:
+            edition_id = int(get_book_edition_id_from_url(href))
+    reviews: list[BookReview] = []
+    for review_div in tree.css('div[id*="resenha"]'):
+        if not _REVIEW_ID_RE.search(review_div.attributes.get("id") or ""):
+            continue
+        review = _parse_review(review_div, book_id, edition_id)
+        if review is not None:
+            reviews.append(review)
+    return reviews, edition_id, tree.css_first("a.proximo") is not None
+
+
+def _parse_review(r: LexborNode, book_id: int, edition_id: int | None) -> BookReview | None:
+    """selectolax counterpart of :func:`pyskoob.parsers.books.parse_review`."""
+
+    review_id = int((r.attributes.get("id") or "").replace("resenha", ""))
+    user_link = r.css_first('a[href*="/usuario/"]')
+    user_url = user_link.attributes.get("href") if user_link is not None else None
+    if not user_url:
+        logger.warning("Skipping review %s due to missing user ID.", review_id)  # pragma: no cover
+        return None
+    star_tag = r.css_first("star-rating")
+    rating = float(star_tag.attributes.get("rate") or "0") if star_tag is not None else 0.0
+    comment_div = next(
+        (div for div in r.css('div[id*="resenhac"]') if _REVIEW_COMMENT_ID_RE.search(div.attributes.get("id") or "")),
+        None,
+    )
+    date = None
+    review_text = ""
+    if comment_div is not None:
+        span = comment_div.css_first("span")
+        date = parse_review_date(_text(span))
+        content_parts = []
+        sibling = span.next if span is not None else None
+        while sibling is not None:
+            if sibling.is_text_node or sibling.is_element_node:
+                text = _text(sibling, "\n")
+                if text:
+                    content_parts.append(text)
+            sibling = sibling.next
+        if not content_parts:
+            content_parts.append(_text(comment_div, "\n"))
+        review_text = "\n".join(filter(None, content_parts)).strip()
+    return BookReview(
+        review_id=review_id,
+        book_id=book_id,
+        edition_id=edition_id,
+        user_id=int(get_user_id_from_url(user_url)),
+        rating=rating,
+        review_text=review_text,
+        reviewed_at=date,
+    )
+
+
+def _string(node: LexborNode) -> str | None:
+    """Mirror BeautifulSoup's ``Tag.string`` for ``node``."""
+
+    children = list(node.iter(include_text=True))
+    if len(children) != 1:
+        return None
+    child = children[0]
+    if child.is_text_node:
+        return child.text_content
+    return _string(child) if not (child.tag or "-").startswith("-") else None
+
+
+def _first_matching(node: LexborNode | None, selector: str, attr: str, pattern: re.Pattern[str]) -> LexborNode | None:
+    """Return the first ``selector`` match whose ``attr`` value matches ``pattern``."""
+
+    if node is None:
+        return None
+    return next((match for match in node.css(selector) if pattern.search(match.attributes.get(attr) or "")), None)
+
+
+def parse_user_reviews_page(html: str, user_id: int) -> tuple[list[BookReview], bool]:
+    """Parse the reviews written by a user.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the ``/estante/resenhas`` page.
+    user_id : int
+        Identifier of the review author.
+
+    Returns
+    -------
+    tuple of (list of BookReview, bool)
+        Parsed reviews and whether a next page exists.
+    """
+
+    tree = LexborHTMLParser(html)
+    reviews = [
+        _parse_user_review(review_div, user_id)
+        for review_div in tree.css('div[id*="resenha"]')
+        if _REVIEW_ID_RE.search(review_div.attributes.get("id") or "")
+    ]
+    has_next_page = any(_string(link) == NEXT_REVIEWS_PAGE_TEXT for link in tree.css("a"))
+    return reviews, has_next_page
+
+
+def _parse_user_review(r: LexborNode, user_id: int) -> BookReview:
+    """selectolax counterpart of ``_UserServiceMixin._parse_reviews_page`` for one review."""
+
+    review_id = int((r.attributes.get("id") or "").replace("resenha", ""))
+    book_anchor = _first_matching(r, "a[href]", "href", _REVIEW_BOOK_HREF_RE)
+    book_url = (book_anchor.attributes.get("href") if book_anchor is not None else None) or ""
+    book_id = int(get_book_id_from_url(book_url))
+    edition_id = int(get_book_edition_id_from_url(book_url))
+    star_tag = r.css_first("star-rating")
+    rating = float(star_tag.attributes.get("rate") or "0") if star_tag is not None else 0.0
+    comment_div = _first_matching(r, 'div[id*="resenhac"]', "id", _REVIEW_COMMENT_ID_RE)
+    span = comment_div.css_first("span") if comment_div is not None else None
+    date = parse_review_date(_text(span))
+    review_text = ""
+    if span is not None:
+        parts = []
+        sibling = span.next
+        while sibling is not None:
+            if (sibling.is_text_node or sibling.is_element_node) and (part := _text(sibling, "\n")):
+                parts.append(part)
+            sibling = sibling.next
+        review_text = "\n".join(parts)
+    return BookReview(
+        review_id=review_id,
+        book_id=book_id,
+        edition_id=edition_id,
+        user_id=user_id,
+        rating=rating,
+        review_text=review_text,
+        reviewed_at=date,
+    )
+
+
+def parse_user_search_page(html: str, base_url: str) -> tuple[list[UserSearch], int, bool]:
+    """Parse a user search page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the ``/usuario/lista`` page.
+    base_url : str
+        Base URL used to expand profile links.
+
+    Returns
+    -------
+    tuple of (list of UserSearch, int, bool)
+        Parsed users, the total reported by the page and whether a next page
+        exists.
+    """
+
+    tree = LexborHTMLParser(html)
+    results: list[UserSearch] = []
+    for div in tree.css("div[style]"):
+        if _SEARCH_RESULT_STYLE not in (div.attributes.get("style") or ""):
+            continue
+        anchor = _first_matching(div, "a[href]", "href", _USER_HREF_RE)
+        if anchor is None:
+            continue  # pragma: no cover - defensive
+        href = anchor.attributes.get("href") or ""
+        match = _USER_HREF_PARTS_RE.search(href)
+        if not match:
+            continue  # pragma: no cover - defensive
+        results.append(UserSearch(id=int(match.group(1)), username=match.group(2), name=_text(anchor), url=f"{base_url}{href}"))
+    total = parse_user_search_total(_text(tree.css_first("div.contador")))
+    return results, total, tree.css_first("a.proximo") is not None
+
+
+def parse_user_relations_page(html: str) -> tuple[list[int], bool]:
+    """Parse a user relations (friends, followers or following) page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the relation listing page.
+
+    Returns
+    -------
+    tuple of (list of int, bool)
+        Related user identifiers in page order and whether a next page exists.
+    """
+
+    tree = LexborHTMLParser(html)
+    users_id: list[int] = []
+    for user_div in tree.css("div.usuarios-mini-lista-txt"):
+        anchor = user_div.css_first("a")
+        if anchor is not None:
+            users_id.append(int(get_user_id_from_url(anchor.attributes.get("href") or "")))
+    return users_id, tree.css_first("div.proximo") is not None
@@ -1,8 +1,9 @@
+"""Parser helpers for author-related pages on Skoob."""
+
 from __future__ import annotations
 
 import re
-
-"""Parser helpers for author-related pages on Skoob."""
+from collections.abc import Callable
 
 from bs4 import Tag
 
@@ -19,6 +20,52 @@ from pyskoob.utils.skoob_parser_utils import (
     get_book_id_from_url,
 )
 
+_AUTHOR_HREF_RE = re.compile(r"/autor/\d+-")
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def _pair_following(root: Tag, labels: list[Tag], matches: Callable[[Tag], bool]) -> list[Tag | None]:
+    """Pair every label with the first following element accepted by ``matches``.
+
+    Equivalent to calling ``label.find_next`` for each label, but walks the
+    document once in source order instead of once per label.
+
+    Parameters
+    ----------
+    root : Tag
+        Element whose descendants contain the labels and their values.
+    labels : list of Tag
+        Label elements, in any order.
+    matches : Callable[[Tag], bool]
+        Predicate identifying value elements.
+
+    Returns
+    -------
+    list of Tag or None
+        The value following each label, aligned with ``labels``.
+    """
+
+    positions: dict[int, list[int]] = {}
+    for i, label in enumerate(labels):
+        positions.setdefault(id(label), []).append(i)
+    values: list[Tag | None] = [None] * len(labels)
+    pending: list[int] = []
+    unseen = len(positions)
+    for el in root.descendants:
+        if not isinstance(el, Tag):
+            continue
+        if pending and matches(el):
+            for i in pending:
+                values[i] = el
+            pending.clear()
+            if not unseen:
+                break
+        found = positions.get(id(el))
+        if found is not None:
+            pending.extend(found)
+            unseen -= 1
+    return values
+
 
 def parse_author_block(div: Tag, base_url: str) -> AuthorSearchResult | None:
     """Parse a search result block for an author.
@@ -43,7 +90,7 @@ def parse_author_block(div: Tag, base_url: str) -> AuthorSearchResult | None:
     """
 
     img_tag = safe_find(div, "img", {"class": "img-rounded"})
-    links = [a for a in safe_find_all(div, "a", {"href": re.compile(r"/autor/\d+-")}) if get_tag_attr(a, "href")]
+    links = [a for a in safe_find_all(div, "a", {"href": _AUTHOR_HREF_RE}) if get_tag_attr(a, "href")]
     link_tag = next((a for a in links if get_tag_text(a)), None)
     if not (img_tag and link_tag):
         return None  # pragma: no cover - malformed author block
@@ -76,7 +123,7 @@ def extract_total_results(soup: Tag) -> int:
     """
 
     contador = safe_find(soup, "div", {"class": "contador"})
-    match = re.search(r"(\d+)", get_tag_text(contador))
+    match = _DIGITS_RE.search(get_tag_text(contador))
     return int(match.group(1)) if match else 0
 
 
@@ -135,16 +182,28 @@ def extract_author_info(soup: Tag) -> tuple[str | None, str | None]:
     birth_date = None
     location = None
     if box_generos:
-        birth_b = box_generos.find("b", string=lambda s: bool(s) and "Nascimento" in s)
+        birth_b = loc_b = None
+        for b in box_generos.find_all("b"):
+            label = b.string or ""
+            if birth_b is None and "Nascimento" in label:
+                birth_b = b
+            if loc_b is None and "Local" in label:
+                loc_b = b
+            if birth_b is not None and loc_b is not None:
+                break
         if birth_b and birth_b.next_sibling:
             birth_date = str(birth_b.next_sibling).strip(" |")
-        loc_b = box_generos.find("b", string=lambda s: bool(s) and "Local" in s)
         if loc_b and loc_b.next_sibling:
             loc_tag = loc_b.next_sibling
             location = get_tag_text(loc_tag) if isinstance(loc_tag, Tag) else str(loc_tag).strip()
     return birth_date, location
 
 
+def _is_percent_div(el: Tag) -> bool:
+    """Return ``True`` for a ``div`` whose only string holds a percentage."""
+    return el.name == "div" and "%" in (el.string or "")
+
+
 def extract_author_stats(soup: Tag) -> AuthorStats:
     """Extract readership and rating statistics for an author.
 
@@ -172,9 +231,9 @@ def extract_author_stats(soup: Tag) -> AuthorStats:
         rating_span = safe_find(stats_div, "span", {"class": "rating"})
         rating_text = get_tag_text(rating_span).replace(",", ".")
         average_rating = float(rating_text) if rating_text else None
-        aval_span = stats_div.find("span", string=lambda t: bool(t) and "avalia" in t.lower())
+        aval_span = next((span for span in stats_div.find_all("span") if "avalia" in (span.string or "").lower()), None)
         if aval_span:
-            aval_match = re.search(r"(\d+)", get_tag_text(aval_span).replace(".", ""))
+            aval_match = _DIGITS_RE.search(get_tag_text(aval_span).replace(".", ""))
             ratings = int(aval_match.group(1)) if aval_match else None
         for bar in safe_find_all(stats_div, "div", {"class": "bar"}):
             label = get_tag_text(safe_find(bar, "a")).lower()
@@ -185,9 +244,9 @@ def extract_author_stats(soup: Tag) -> AuthorStats:
             elif "seguidores" in label:
                 followers = value
     star_ratings: dict[str, float] = {}
-    for img in safe_find_all(soup, "img", {"src": re.compile("estrela")}):
+    stars = [img for img in safe_find_all(soup, "img", {"src": True}) if "estrela" in get_tag_attr(img, "src", "")]
+    for img, percent_tag in zip(stars, _pair_following(soup, stars, _is_percent_div), strict=True):
         alt = get_tag_attr(img, "alt")
-        percent_tag = img.find_next("div", string=re.compile("%"))
         if alt and percent_tag:
             star_ratings[alt] = float(get_tag_text(percent_tag).replace("%", ""))
     return AuthorStats(
@@ -216,17 +275,21 @@ def extract_gender_percentages(soup: Tag) -> dict[str, float]:
         Mapping containing ``"male"`` and/or ``"female"`` keys when present.
     """
 
+    icons: dict[str, Tag] = {}
+    for icon in safe_find_all(soup, "i", {"class": True}):
+        for cls in icon.get_attribute_list("class"):
+            for key in ("male", "female"):
+                if key not in icons and f"icon-{key}" in cls:
+                    icons[key] = icon
+        if len(icons) == 2:
+            break
     gender: dict[str, float] = {}
-    male_icon = safe_find(soup, "i", {"class": re.compile("icon-male")})
-    if male_icon:
-        male_text = get_tag_text(male_icon.find_next("span")).replace("%", "")
-        if male_text:
-            gender["male"] = float(male_text)
-    female_icon = safe_find(soup, "i", {"class": re.compile("icon-female")})
-    if female_icon:
-        female_text = get_tag_text(female_icon.find_next("span")).replace("%", "")
-        if female_text:
-            gender["female"] = float(female_text)
+    keys = [key for key in ("male", "female") if key in icons]
+    spans = _pair_following(soup, [icons[key] for key in keys], lambda el: el.name == "span")
+    for key, span in zip(keys, spans, strict=True):
+        text = get_tag_text(span).replace("%", "")
+        if text:
+            gender[key] = float(text)
     return gender
 
 
@@ -280,15 +343,20 @@ def extract_author_videos(soup: Tag, base_url: str) -> list[AuthorVideo]:
         Video information referenced on the page.
     """
 
-    return [
-        AuthorVideo(
-            url=f"{base_url}{get_tag_attr(a, 'href')}",
-            thumbnail_url=get_tag_attr(safe_find(a, "img"), "src"),
-            title=get_tag_attr(safe_find(a, "img"), "alt") or get_tag_text(a),
+    videos: list[AuthorVideo] = []
+    for div in safe_find_all(soup, "div", {"class": "livro-perfil-videos-cont"}):
+        a = safe_find(div, "a")
+        if a is None:
+            continue
+        img = safe_find(a, "img")
+        videos.append(
+            AuthorVideo(
+                url=f"{base_url}{a.get('href')}",
+                thumbnail_url=get_tag_attr(img, "src"),
+                title=get_tag_attr(img, "alt") or a.get_text(strip=True),
+            )
         )
-        for a in [safe_find(div, "a") for div in safe_find_all(soup, "div", {"class": "livro-perfil-videos-cont"})]
-        if a
-    ]
+    return videos
 
 
 def extract_author_metadata(
@@ -378,8 +446,8 @@ def parse_author_book_div(div: Tag, base_url: str) -> BookSearchResult | None:
     title = get_tag_attr(anchor, "title") or get_tag_text(anchor)
     edition_id_text = get_tag_attr(div, "id")
     try:
-        edition_id = int(edition_id_text) if edition_id_text else int(get_book_id_from_url(href))
         book_id = int(get_book_id_from_url(href)) if href else 0
+        edition_id = int(edition_id_text) if edition_id_text else book_id
     except ValueError:  # pragma: no cover - defensive
         return None
     return BookSearchResult(
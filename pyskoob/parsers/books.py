@@ -1,10 +1,18 @@
-from __future__ import annotations
+"""Parser helpers for book-related pages on Skoob.
+
+The helpers receive tags from documents built by
+:func:`pyskoob.utils.bs4_utils.parse_html`, which uses the ``lxml`` tree
+builder.
+"""
 
-"""Parser helpers for book-related pages on Skoob."""
+from __future__ import annotations
 
 import logging
 import re
+import sys
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from urllib.parse import urlparse, urlunparse
 
 from bs4 import Tag
@@ -15,6 +23,7 @@ from pyskoob.utils.bs4_utils import (
     get_tag_text,
     safe_find,
     safe_find_all,
+    safe_iter_all,
 )
 from pyskoob.utils.skoob_parser_utils import (
     get_book_edition_id_from_url,
@@ -24,39 +33,11 @@ from pyskoob.utils.skoob_parser_utils import (
 
 logger = logging.getLogger(__name__)
 
-
-def extract_user_ids_from_html(soup: Tag) -> list[int]:
-    """Collect user IDs from the readers page.
-
-    The readers listing is composed of ``div.livro-leitor-container`` blocks
-    where each contains a link to ``/usuario/<id>-``. This helper parses those
-    links and returns the numeric user IDs.
-
-    Parameters
-    ----------
-    soup : Tag
-        Parsed readers page.
-
-    Returns
-    -------
-    list of int
-        Numeric user identifiers found on the page.
-    """
-
-    users_html = safe_find_all(soup, "div", {"class": "livro-leitor-container"})
-    users_id: list[int] = []
-    for user_div in users_html:
-        user_link = safe_find(user_div, "a")
-        href = get_tag_attr(user_link, "href")
-        if href:
-            user_id = get_user_id_from_url(href)
-            if user_id:
-                users_id.append(int(user_id))
-            else:  # pragma: no cover - malformed URL
-                logger.warning("Could not extract user ID from URL: %s", href)
-        else:
-            logger.warning("Skipping user_div due to missing 'a' tag or href attribute.")
-    return users_id
+_USER_ID_RE = re.compile(r"/usuario/(\d+)")
+_REVIEW_ID_RE = re.compile(r"resenha\d+")
+_REVIEW_COMMENT_ID_RE = re.compile(r"resenhac\d+")
+_USER_HREF_RE = re.compile(r"/usuario/")
+_TOTAL_RE = re.compile(r"(\d+)\s+encontrados")
 
 
 def extract_edition_id_from_reviews_page(soup: Tag) -> int | None:
@@ -116,7 +97,7 @@ def parse_review(r: Tag, book_id: int, edition_id: int | None) -> BookReview | N
     if review_id is None:
         logger.warning("Skipping review due to missing or invalid ID: %s", get_tag_attr(r, "id"))  # pragma: no cover
         return None
-    user_link = safe_find(r, "a", {"href": re.compile(r"/usuario/")})
+    user_link = safe_find(r, "a", {"href": _USER_HREF_RE})
     user_url = get_tag_attr(user_link, "href")
     user_id = int(get_user_id_from_url(user_url)) if user_url else None
     if user_id is None:
@@ -124,7 +105,7 @@ def parse_review(r: Tag, book_id: int, edition_id: int | None) -> BookReview | N
         return None
     star_tag = safe_find(r, "star-rating")
     rating = float(get_tag_attr(star_tag, "rate", "0")) if star_tag else 0.0
-    comment_div = safe_find(r, "div", {"id": re.compile(r"resenhac\d+")})
+    comment_div = safe_find(r, "div", {"id": _REVIEW_COMMENT_ID_RE})
     date, review_text = extract_review_date_and_text(comment_div, review_id)
     return BookReview(
         review_id=review_id,
@@ -137,12 +118,40 @@ def parse_review(r: Tag, book_id: int, edition_id: int | None) -> BookReview | N
     )
 
 
+def iter_reviews(soup: Tag, book_id: int, edition_id: int | None) -> Iterator[BookReview]:
+    """Yield the reviews found on a reviews page one at a time.
+
+    Review blocks that :func:`parse_review` cannot handle are skipped, so
+    callers can start consuming reviews without materialising the page first.
+
+    Parameters
+    ----------
+    soup : Tag
+        Parsed reviews page.
+    book_id : int
+        Identifier of the reviewed book.
+    edition_id : int or None
+        Edition identifier for the reviews.
+
+    Yields
+    ------
+    BookReview
+        Each successfully parsed review, in page order.
+    """
+
+    for r in safe_find_all(soup, "div", {"id": _REVIEW_ID_RE}):
+        review = parse_review(r, book_id, edition_id)
+        if review is not None:
+            yield review
+
+
 def extract_review_date_and_text(comment_div: Tag | None, review_id: int) -> tuple[datetime | None, str]:
     """Pull the review date and textual content from the comment block.
 
     The comment container places the date inside the first ``<span>`` element
     with siblings representing the review text. All textual siblings are
-    concatenated with newlines to form the final comment.
+    concatenated with newlines to form the final comment; when there are none
+    the whole block text is used.
 
     Parameters
     ----------
@@ -161,24 +170,50 @@ def extract_review_date_and_text(comment_div: Tag | None, review_id: int) -> tup
     review_text = ""
     if comment_div:
         span = safe_find(comment_div, "span")
-        date_str = get_tag_text(span)
-        if date_str:
-            try:
-                date = datetime.strptime(date_str, "%d/%m/%Y")
-            except ValueError:
-                date = None
-        content_parts = []
-        for child in span.next_siblings if span else []:
-            if hasattr(child, "get_text"):
-                text = child.get_text(separator="\n", strip=True)
-                if text:
-                    content_parts.append(text)
-        if not content_parts and comment_div:
-            content_parts.append(comment_div.get_text(separator="\n", strip=True))
-        review_text = "\n".join(filter(None, content_parts)).strip()
+        date = parse_review_date(get_tag_text(span))
+        # Flatten the block once; when the date span leads the block, the
+        # review is whatever follows its text.
+        review_text = comment_div.get_text(separator="\n", strip=True)
+        if span is not None:
+            date_text = span.get_text(separator="\n", strip=True)
+            if span.parent is comment_div and review_text.startswith(date_text):
+                review_text = review_text[len(date_text) :].lstrip("\n") or review_text
+            else:
+                content_parts = [text for child in span.next_siblings if (text := child.get_text(separator="\n", strip=True))]
+                review_text = "\n".join(content_parts) or review_text
     return date, review_text
 
 
+def parse_review_date(date_str: str) -> datetime | None:
+    """Parse a ``dd/mm/YYYY`` review date.
+
+    Parameters
+    ----------
+    date_str : str
+        Date text shown next to the review.
+
+    Returns
+    -------
+    datetime or None
+        Parsed date, or ``None`` when the text is empty or malformed.
+    """
+
+    if not date_str:
+        return None
+    try:
+        # Building the date from the split fields avoids strptime
+        # re-parsing the format string for every review; the field widths
+        # are the ones ``%d/%m/%Y`` accepts.
+        parts = date_str.split("/")
+        if len(parts) == 3:
+            day, month, year = parts
+            if len(day) <= 2 and len(month) <= 2 and len(year) == 4 and day.isdigit() and month.isdigit() and year.isdigit():
+                return datetime(int(year), int(month), int(day))
+        return datetime.strptime(date_str, "%d/%m/%Y")
+    except ValueError:
+        return None
+
+
 def parse_search_result(book_div: Tag, base_url: str) -> BookSearchResult | None:
     """Parse a search result block into a :class:`BookSearchResult`.
 
@@ -206,7 +241,7 @@ def parse_search_result(book_div: Tag, base_url: str) -> BookSearchResult | None
         return None
     title = get_tag_attr(container, "title")
     book_url = f"{base_url}{get_tag_attr(container, 'href')}"
-    img_url = extract_img_url(container)
+    img_url = _extract_img_url_from_tag(container)
     try:
         book_id = int(get_book_id_from_url(book_url))
         edition_id = int(get_book_edition_id_from_url(book_url))
@@ -231,7 +266,9 @@ def extract_img_url(container: Tag | str) -> str:
     """Normalize a cover image URL.
 
     Handles both ``<img>`` tags and raw string URLs. Relative or protocol-
-    relative URLs are converted into absolute ``https`` URLs.
+    relative URLs are converted into absolute ``https`` URLs. Internal callers
+    know which of the two they hold and use :func:`_extract_img_url_from_tag`
+    or :func:`normalize_img_url` directly.
 
     Parameters
     ----------
@@ -243,17 +280,43 @@ def extract_img_url(container: Tag | str) -> str:
     str
         Normalized image URL, or an empty string when unavailable.
     """
-    src = ""
-    if isinstance(container, Tag) and container.img and isinstance(container.img, Tag):
-        src = get_tag_attr(container.img, "src") or ""
-    elif isinstance(container, str):
-        src = container
-    if src:
-        parsed = urlparse(src, scheme="https")
-        if parsed.netloc:
-            return urlunparse(parsed)
-        if src.startswith("//"):
-            return f"https:{src}"
+    if isinstance(container, str):
+        return normalize_img_url(container)
+    return _extract_img_url_from_tag(container)
+
+
+def _extract_img_url_from_tag(container: Tag) -> str:
+    """Return the normalized ``src`` of the first ``<img>`` in ``container``."""
+
+    return normalize_img_url(get_tag_attr(container.img, "src") or "")
+
+
+def normalize_img_url(src: str) -> str:
+    """Turn a raw cover URL into an absolute ``https`` URL.
+
+    Parameters
+    ----------
+    src : str
+        Image URL as found in the page or API payload.
+
+    Returns
+    -------
+    str
+        Normalized image URL, or an empty string when ``src`` has no host.
+    """
+    if not src:
+        return ""
+    # Covers are almost always absolute or protocol-relative; handle those
+    # without going through urlparse/urlunparse.
+    if src.startswith("//"):
+        return f"https:{src}"
+    if src.startswith(("https://", "http://")):
+        netloc_start = src.index("//") + 2
+        if src[netloc_start : netloc_start + 1] not in ("", "/", "?", "#"):
+            return src
+    parsed = urlparse(src, scheme="https")
+    if parsed.netloc:
+        return urlunparse(parsed)
     return ""
 
 
@@ -277,19 +340,53 @@ def extract_publisher_and_isbn(book_div: Tag) -> tuple[str | None, str | None]:
 
     detalhes2sub = safe_find(book_div, "div", {"class": "detalhes-2-sub"})
     detalhes2sub_div = detalhes2sub.div if detalhes2sub else None
-    spans = safe_find_all(detalhes2sub_div, "span") if detalhes2sub_div else []
-    cleaned_spans = [text for span in spans if (text := span.get_text(strip=True)) and text != "|"]
-    isbn_pattern = re.compile(r"^\d{9,13}$|^B0[A-Z0-9]{8,}$")
+    spans = safe_iter_all(detalhes2sub_div, "span")
+    # Only the ISBN and publisher texts are used, so stop extracting text once
+    # both have been seen instead of flattening every span in the block.
+    texts = (text for span in spans if (text := span.get_text(strip=True)) and text != "|")
+    return split_publisher_and_isbn(list(islice(texts, 2)))
+
+
+def split_publisher_and_isbn(texts: list[str]) -> tuple[str | None, str | None]:
+    """Interpret the cleaned detail texts of a search result.
+
+    Parameters
+    ----------
+    texts : list of str
+        Non-empty span texts from ``div.detalhes-2-sub`` with the ``"|"``
+        separators removed.
+
+    Returns
+    -------
+    tuple of (str or None, str or None)
+        Publisher name and ISBN respectively.
+    """
+
     isbn: str | None = None
     publisher: str | None = None
-    if cleaned_spans:
-        if isbn_pattern.match(cleaned_spans[0]):
-            isbn = cleaned_spans[0]
-        if len(cleaned_spans) > 1:
-            publisher = cleaned_spans[1]
+    if texts:
+        if _looks_like_isbn(texts[0]):
+            isbn = texts[0]
+        if len(texts) > 1:
+            # A handful of publishers cover most results, so share one string
+            # per name across all parsed pages.
+            publisher = sys.intern(texts[1])
     return publisher, isbn
 
 
+def _looks_like_isbn(text: str) -> bool:
+    """Return ``True`` for 9-13 digit ISBNs and ``B0``-prefixed ASINs.
+
+    Equivalent to ``^\\d{9,13}$|^B0[A-Z0-9]{8,}$`` but answered with string
+    predicates, which is cheaper than entering the regex engine per result.
+    """
+
+    if text.isdecimal():
+        return 9 <= len(text) <= 13
+    # ``isupper`` holds because of the leading "B"; it rejects lowercase letters.
+    return len(text) >= 10 and text.startswith("B0") and text.isascii() and text.isalnum() and text.isupper()
+
+
 def extract_rating(book_div: Tag, title: str) -> float | None:
     """Parse the star rating displayed in a search result.
 
@@ -308,17 +405,35 @@ def extract_rating(book_div: Tag, title: str) -> float | None:
 
     star_mini = safe_find(book_div, "div", {"class": "star-mini"})
     if star_mini:
-        strong_tag = safe_find(star_mini, "strong")
-        rating_text = get_tag_text(strong_tag)
-        if rating_text:
-            try:
-                return float(rating_text.replace(",", "."))
-            except ValueError:  # pragma: no cover - invalid rating
-                logger.warning(
-                    "Could not parse rating '%s' for book '%s'. Setting to None.",
-                    rating_text,
-                    title,
-                )
+        return parse_rating(get_tag_text(safe_find(star_mini, "strong")), title)
+    return None
+
+
+def parse_rating(rating_text: str, title: str) -> float | None:
+    """Convert a rating such as ``"4,5"`` into a float.
+
+    Parameters
+    ----------
+    rating_text : str
+        Rating text using a comma as decimal separator.
+    title : str
+        Title of the book used for logging.
+
+    Returns
+    -------
+    float or None
+        Parsed rating or ``None`` when the text is empty or invalid.
+    """
+
+    if rating_text:
+        try:
+            return float(rating_text.replace(",", "."))
+        except ValueError:  # pragma: no cover - invalid rating
+            logger.warning(
+                "Could not parse rating '%s' for book '%s'. Setting to None.",
+                rating_text,
+                title,
+            )
     return None
 
 
@@ -337,12 +452,26 @@ def extract_total_results(soup: Tag) -> int:
         cannot be parsed.
     """
 
-    total_results_tag = safe_find(soup, "div", {"class": "contador"})
-    if total_results_tag:
-        total_results_text = get_tag_text(total_results_tag)
-        match = re.search(r"(\d+)\s+encontrados", total_results_text)
-        if match:
-            return int(match.group(1))
+    return parse_total_results(get_tag_text(safe_find(soup, "div", {"class": "contador"})))
+
+
+def parse_total_results(text: str) -> int:
+    """Read the result count from a ``"<n> encontrados"`` counter text.
+
+    Parameters
+    ----------
+    text : str
+        Text of the ``div.contador`` element.
+
+    Returns
+    -------
+    int
+        Number of results, or ``0`` when the pattern is missing.
+    """
+
+    match = _TOTAL_RE.search(text)
+    if match:
+        return int(match.group(1))
     return 0  # pragma: no cover - default when pattern missing
 
 
@@ -368,8 +497,8 @@ def clean_book_json_data(json_data: dict, base_url: str) -> dict:
     data["serie"] = data.get("serie") or None
     data["volume"] = None if not data.get("volume") or str(data["volume"]) == "0" else str(data["volume"])
     data["mes"] = None if not data.get("mes") or str(data["mes"]).strip() == "" else data["mes"]
-    img_url = data.get("img_url", "")
-    data["cover_url"] = extract_img_url(img_url)
+    img_url = data.get("img_url") or ""
+    data["cover_url"] = normalize_img_url(img_url)
     generos = data.get("generos")
     data["generos"] = generos if generos else None
     return data
@@ -1,11 +1,28 @@
+"""Parser helpers for publisher-related pages on Skoob."""
+
 from __future__ import annotations
 
-"""Parser helpers for publisher-related pages on Skoob."""
+import re
+
+from bs4 import NavigableString, Tag
+
+from pyskoob.models.publisher import Publisher, PublisherItem, PublisherStats
+from pyskoob.utils.bs4_utils import get_tag_attr, get_tag_text, parse_html, safe_find, safe_find_all
 
-from bs4 import Tag
+WEBSITE_LINK_TEXT = "Site oficial"
 
-from pyskoob.models.publisher import PublisherAuthor, PublisherItem, PublisherStats
-from pyskoob.utils.bs4_utils import get_tag_attr, get_tag_text, safe_find
+_HISTORY_ID = "historico"
+_STATS_ID = "vt_estatisticas"
+_RELEASES_ID = "livros_lancamentos"
+_SECTION_IDS = frozenset({_HISTORY_ID, _STATS_ID, _RELEASES_ID})
+_RELEASE_ITEM = {"class": "livro-capa-mini"}
+
+_FOLLOWERS_RE = re.compile("Seguidor")
+_RATINGS_RE = re.compile("Avalia")
+# Counts use "." as the thousands separator and ratings "," as the decimal mark.
+_COUNT_RE = re.compile(r"\d[\d.]*")
+_PERCENT_RE = re.compile(r"(\d+)%?")
+_RATING_RE = re.compile(r"(\d+(?:[.,]\d+)?)?\s*/\s*(\d[\d.]*)?")
 
 
 def parse_stats(div: Tag | None) -> PublisherStats:
@@ -29,26 +46,22 @@ def parse_stats(div: Tag | None) -> PublisherStats:
     if not div:
         return PublisherStats()  # pragma: no cover - default empty stats
     followers = avg = ratings = male = female = None
-    seg_span = div.find("span", string=lambda text: bool(text and "Seguidor" in text))
+    seg_span = div.find("span", string=_FOLLOWERS_RE)
     if seg_span:
-        followers_text = get_tag_text(seg_span.find_next("span")).replace(".", "")
-        followers = int(followers_text) if followers_text.isdigit() else None
-    aval_span = div.find("span", string=lambda text: bool(text and "Avalia" in text))
+        followers = _parse_count(get_tag_text(seg_span.find_next("span")))
+    aval_span = div.find("span", string=_RATINGS_RE)
     if aval_span:
-        rating_info = get_tag_text(aval_span.find_next("span"))
-        if "/" in rating_info:
-            rating_part, total_part = (p.strip() for p in rating_info.split("/"))
+        match = _RATING_RE.fullmatch(get_tag_text(aval_span.find_next("span")))
+        if match:
+            rating_part, total_part = match.groups()
             avg = float(rating_part.replace(",", ".")) if rating_part else None
-            clean_total = total_part.replace(".", "")
-            ratings = int(clean_total) if clean_total.isdigit() else None
+            ratings = _parse_count(total_part or "")
     male_icon = div.find("i", {"class": "icon-male"})
     if male_icon:
-        male_text = get_tag_text(male_icon.find_next("span")).replace("%", "")
-        male = int(male_text) if male_text.isdigit() else None
+        male = _parse_percent(get_tag_text(male_icon.find_next("span")))
     female_icon = div.find("i", {"class": "icon-female"})
     if female_icon:
-        female_text = get_tag_text(female_icon.find_next("span")).replace("%", "")
-        female = int(female_text) if female_text.isdigit() else None
+        female = _parse_percent(get_tag_text(female_icon.find_next("span")))
     return PublisherStats(
         followers=followers,
         average_rating=avg,
@@ -58,6 +71,19 @@ def parse_stats(div: Tag | None) -> PublisherStats:
     )
 
 
+def _parse_count(text: str) -> int | None:
+    """Parse a count such as ``"1.234"``, returning ``None`` for other text."""
+
+    return int(text.replace(".", "")) if _COUNT_RE.fullmatch(text) else None
+
+
+def _parse_percent(text: str) -> int | None:
+    """Parse a percentage such as ``"30%"``, returning ``None`` for other text."""
+
+    match = _PERCENT_RE.fullmatch(text)
+    return int(match.group(1)) if match else None
+
+
 def parse_book(div: Tag, base_url: str) -> PublisherItem:
     """Parse a book entry listed on a publisher page.
 
@@ -86,31 +112,101 @@ def parse_book(div: Tag, base_url: str) -> PublisherItem:
     )
 
 
-def parse_author(div: Tag, base_url: str) -> PublisherAuthor:
-    """Parse an author entry from a publisher page.
+def extract_website(soup: Tag) -> str | None:
+    """Return the target of the publisher's "Site oficial" link.
 
-    The entry includes a link with the author's profile image and a heading
-    containing the name. The parser returns the absolute profile URL, author
-    name and image URL.
+    Equivalent to ``soup.find("a", string="Site oficial")`` but only compares
+    text nodes and stops at the first match, instead of computing the
+    ``.string`` of every anchor on the page.
 
     Parameters
     ----------
-    div : Tag
-        Container representing a single author.
+    soup : Tag
+        Parsed publisher page.
+
+    Returns
+    -------
+    str or None
+        The link's ``href``, or ``None`` if the page has no such link.
+    """
+
+    for element in soup.descendants:
+        if type(element) is NavigableString and element == WEBSITE_LINK_TEXT:
+            website = _website_link_target(element)
+            if website is not None:
+                return website
+    return None
+
+
+def _website_link_target(text: NavigableString) -> str | None:
+    """Return the ``href`` of the anchor whose ``.string`` is ``text``."""
+
+    anchor = text.find_parent("a")
+    if anchor is not None and anchor.string == WEBSITE_LINK_TEXT:
+        return get_tag_attr(anchor, "href")
+    return None
+
+
+def _scan_publisher_page(soup: Tag, find_website: bool) -> tuple[Tag | None, dict[str, Tag], str | None]:
+    """Locate the parts of a publisher page in a single walk of the tree.
+
+    Collects the first ``<h2>``, the section ``div`` elements keyed by id and,
+    when ``find_website`` is set, the website link. The walk stops as soon as
+    everything has been found.
+    """
+
+    heading: Tag | None = None
+    sections: dict[str, Tag] = {}
+    website: str | None = None
+    for element in soup.descendants:
+        if isinstance(element, Tag):
+            if element.name == "h2":
+                if heading is None:
+                    heading = element
+            elif element.name == "div":
+                element_id = element.get("id")
+                if isinstance(element_id, str) and element_id in _SECTION_IDS:
+                    sections.setdefault(element_id, element)
+        elif find_website and type(element) is NavigableString and element == WEBSITE_LINK_TEXT:
+            website = _website_link_target(element)
+            find_website = website is None
+        if heading is not None and len(sections) == len(_SECTION_IDS) and not find_website:
+            break
+    return heading, sections, website
+
+
+def parse_publisher_page(html: str, publisher_id: int, base_url: str) -> Publisher:
+    """Parse a publisher details page.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML of the ``/editora/<id>`` page.
+    publisher_id : int
+        Identifier of the publisher.
     base_url : str
-        Base URL used to expand the author link.
+        Base URL used to expand the release links.
 
     Returns
     -------
-    PublisherAuthor
-        Structured author information extracted from the block.
+    Publisher
+        Parsed publisher information including latest releases and stats.
     """
 
-    anchor = safe_find(div, "a")
-    name_tag = safe_find(div, "h3")
-    img_tag = safe_find(anchor, "img")
-    return PublisherAuthor(
-        url=f"{base_url}{get_tag_attr(anchor, 'href')}",
-        name=get_tag_text(name_tag),
-        img_url=get_tag_attr(img_tag, "src"),
+    soup = parse_html(html)
+    # Most publisher pages have no website link; only look for it when the
+    # text occurs in the raw HTML.
+    heading, sections, website = _scan_publisher_page(soup, WEBSITE_LINK_TEXT in html)
+    name = get_tag_text(heading) or get_tag_text(soup.title)
+    description = get_tag_text(sections.get(_HISTORY_ID))
+    stats = parse_stats(sections.get(_STATS_ID))
+    releases_div = sections.get(_RELEASES_ID)
+    releases = [parse_book(div, base_url) for div in safe_find_all(releases_div, "div", _RELEASE_ITEM)]
+    return Publisher(
+        id=publisher_id,
+        name=name,
+        description=description,
+        website=website,
+        stats=stats,
+        last_releases=releases,
     )
@@ -0,0 +1,38 @@
+"""Parser helpers for user-related pages on Skoob."""
+
+from __future__ import annotations
+
+import re
+
+NEXT_REVIEWS_PAGE_TEXT = " Próxima"
+"""Text of the link to the next page of a user's reviews."""
+
+_SEARCH_TOTAL_RE = re.compile(r"\s*(\d[\d.]*)\s*encontrados")
+
+
+def parse_user_search_total(text: str) -> int:
+    """Read the result count from a user search ``"<n> encontrados"`` counter.
+
+    Parameters
+    ----------
+    text : str
+        Text of the ``div.contador`` element.
+
+    Returns
+    -------
+    int
+        Number of users found, or ``0`` when the counter is missing. Dots
+        used as thousands separators are ignored.
+
+    Examples
+    --------
+    >>> parse_user_search_total("12 encontrados")
+    12
+    >>> parse_user_search_total("1.234 encontrados")
+    1234
+    >>> parse_user_search_total("")
+    0
+    """
+
+    match = _SEARCH_TOTAL_RE.match(text)
+    return int(match.group(1).replace(".", "")) if match else 0
@@ -1,7 +1,7 @@
 """Profile management helpers for authenticated Skoob users."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from pyskoob.auth import AsyncAuthService, AuthService
@@ -10,7 +10,8 @@ from pyskoob.http.client import AsyncHTTPClient, SyncHTTPClient
 from pyskoob.internal.async_authenticated import AsyncAuthenticatedService
 from pyskoob.internal.authenticated import AuthenticatedService
 from pyskoob.models.enums import BookLabel, BookShelf, BookStatus
-from pyskoob.utils.sync_async import maybe_await, run_sync
+from pyskoob.utils.fast_json import response_success
+from pyskoob.utils.sync_async import gather_bounded, maybe_await, run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,9 @@ class _ProfileServiceMixin:
     base_url: str
     _validate_login: Callable[[], Any]
 
+    bulk_concurrency: int = 16
+    """Maximum number of requests a bulk operation keeps in flight on the async service."""
+
     async def _add_book_label(self, edition_id: int, label: BookLabel) -> bool:
         """Add a label to a book.
 
@@ -42,7 +46,7 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/v1/label_add/{edition_id}/{label.value}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        return response.json().get("success", False)
+        return response_success(response)
 
     async def _remove_book_label(self, edition_id: int) -> bool:
         """Remove a label from a book.
@@ -62,7 +66,7 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/v1/label_del/{edition_id}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        return response.json().get("success", False)
+        return response_success(response)
 
     async def _update_book_status(self, edition_id: int, status: BookStatus) -> bool:
         """Update the user's status for a book.
@@ -84,7 +88,7 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/v1/shelf_add/{edition_id}/{status.value}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        return response.json().get("success", False)
+        return response_success(response)
 
     async def _remove_book_status(self, edition_id: int) -> bool:
         """Remove the user's status for a book.
@@ -104,7 +108,7 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/v1/shelf_del/{edition_id}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        return response.json().get("success", False)
+        return response_success(response)
 
     async def _change_book_shelf(self, edition_id: int, bookshelf: BookShelf) -> bool:
         """Move a book to a different bookshelf.
@@ -126,7 +130,7 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/estante/prateleira/{edition_id}/{bookshelf.value}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        return response.json().get("success", False)
+        return response_success(response)
 
     async def _rate_book(self, edition_id: int, rating: float) -> bool:
         """Rate a book in the authenticated profile.
@@ -157,10 +161,74 @@ class _ProfileServiceMixin:
         url = f"{self.base_url}/v1/book_rate/{edition_id}/{rating}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        if not response.json().get("success"):
+        if not response_success(response):
             raise ProfileError("Failed to rate the book.")
         return True
 
+    async def _add_book_labels(self, labels: Iterable[tuple[int, BookLabel]]) -> list[bool]:
+        """Add several labels, up to :attr:`bulk_concurrency` at a time on an async client.
+
+        Parameters
+        ----------
+        labels : Iterable[tuple[int, BookLabel]]
+            ``(edition_id, label)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Result of each :meth:`_add_book_label` call, in input order.
+        """
+
+        await maybe_await(self._validate_login)
+        return await gather_bounded((self._add_book_label(edition_id, label) for edition_id, label in labels), self.bulk_concurrency)
+
+    async def _update_book_statuses(self, statuses: Iterable[tuple[int, BookStatus]]) -> list[bool]:
+        """Update several reading statuses, up to :attr:`bulk_concurrency` at a time on an async client.
+
+        Parameters
+        ----------
+        statuses : Iterable[tuple[int, BookStatus]]
+            ``(edition_id, status)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Result of each :meth:`_update_book_status` call, in input order.
+        """
+
+        await maybe_await(self._validate_login)
+        return await gather_bounded(
+            (self._update_book_status(edition_id, status) for edition_id, status in statuses), self.bulk_concurrency
+        )
+
+    async def _rate_books(self, ratings: Iterable[tuple[int, float]]) -> list[bool]:
+        """Rate several books, up to :attr:`bulk_concurrency` at a time on an async client.
+
+        Parameters
+        ----------
+        ratings : Iterable[tuple[int, float]]
+            ``(edition_id, rating)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            ``True`` for each stored rating, in input order.
+
+        Raises
+        ------
+        ValueError
+            If any rating is outside the ``0``-``5`` range. Nothing is sent in
+            that case.
+        ProfileError
+            If the service fails to persist one of the ratings.
+        """
+
+        await maybe_await(self._validate_login)
+        pairs = list(ratings)
+        if any(not (0 <= rating <= 5) for _, rating in pairs):
+            raise ValueError("Rating must be between 0 and 5.")
+        return await gather_bounded((self._rate_book(edition_id, rating) for edition_id, rating in pairs), self.bulk_concurrency)
+
 
 class SkoobProfileService(_ProfileServiceMixin, AuthenticatedService):
     """Perform profile-related actions such as labeling and rating books."""
@@ -322,6 +390,79 @@ class SkoobProfileService(_ProfileServiceMixin, AuthenticatedService):
         """
         return run_sync(self._rate_book(edition_id, rating))
 
+    def add_book_labels(self, labels: Iterable[tuple[int, BookLabel]]) -> list[bool]:
+        """Adds labels to several books, one request at a time.
+
+        Use :class:`AsyncSkoobProfileService` to send the requests concurrently.
+
+        Parameters
+        ----------
+        labels : Iterable[tuple[int, BookLabel]]
+            ``(edition_id, label)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Whether each label was added, in input order.
+
+        Examples
+        --------
+        >>> service.add_book_labels([(10, BookLabel.FAVORITE), (11, BookLabel.FAVORITE)])
+        [True, True]
+        """
+        return run_sync(self._add_book_labels(labels))
+
+    def update_book_statuses(self, statuses: Iterable[tuple[int, BookStatus]]) -> list[bool]:
+        """Updates the status of several books, one request at a time.
+
+        Use :class:`AsyncSkoobProfileService` to send the requests concurrently.
+
+        Parameters
+        ----------
+        statuses : Iterable[tuple[int, BookStatus]]
+            ``(edition_id, status)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Whether each status was updated, in input order.
+
+        Examples
+        --------
+        >>> service.update_book_statuses([(10, BookStatus.READ)])
+        [True]
+        """
+        return run_sync(self._update_book_statuses(statuses))
+
+    def rate_books(self, ratings: Iterable[tuple[int, float]]) -> list[bool]:
+        """Rates several books, one request at a time.
+
+        Use :class:`AsyncSkoobProfileService` to send the requests concurrently.
+
+        Parameters
+        ----------
+        ratings : Iterable[tuple[int, float]]
+            ``(edition_id, rating)`` pairs with ratings from 0 to 5.
+
+        Returns
+        -------
+        list[bool]
+            ``True`` for each rated book, in input order.
+
+        Raises
+        ------
+        ValueError
+            If any rating is not between 0 and 5.
+        ProfileError
+            If the service fails to persist one of the ratings.
+
+        Examples
+        --------
+        >>> service.rate_books([(10, 4.5), (11, 3)])
+        [True, True]
+        """
+        return run_sync(self._rate_books(ratings))
+
 
 class AsyncSkoobProfileService(_ProfileServiceMixin, AsyncAuthenticatedService):  # pragma: no cover - thin async wrapper
     """Asynchronous variant of :class:`SkoobProfileService`."""
@@ -432,3 +573,51 @@ class AsyncSkoobProfileService(_ProfileServiceMixin, AsyncAuthenticatedService):
         """
 
         return await self._rate_book(edition_id, rating)
+
+    async def add_book_labels(self, labels: Iterable[tuple[int, BookLabel]]) -> list[bool]:
+        """Add labels to several books concurrently.
+
+        Parameters
+        ----------
+        labels : Iterable[tuple[int, BookLabel]]
+            ``(edition_id, label)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Whether each label was added, in input order.
+        """
+
+        return await self._add_book_labels(labels)
+
+    async def update_book_statuses(self, statuses: Iterable[tuple[int, BookStatus]]) -> list[bool]:
+        """Update the status of several books concurrently.
+
+        Parameters
+        ----------
+        statuses : Iterable[tuple[int, BookStatus]]
+            ``(edition_id, status)`` pairs.
+
+        Returns
+        -------
+        list[bool]
+            Whether each status was updated, in input order.
+        """
+
+        return await self._update_book_statuses(statuses)
+
+    async def rate_books(self, ratings: Iterable[tuple[int, float]]) -> list[bool]:
+        """Rate several books concurrently.
+
+        Parameters
+        ----------
+        ratings : Iterable[tuple[int, float]]
+            ``(edition_id, rating)`` pairs with ratings between ``0`` and ``5``.
+
+        Returns
+        -------
+        list[bool]
+            ``True`` for each rated book, in input order.
+        """
+
+        return await self._rate_books(ratings)
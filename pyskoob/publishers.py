@@ -1,8 +1,9 @@
 """Retrieve publisher information, books and authors from Skoob."""
 
+import asyncio
 import logging
-from collections.abc import Callable
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable
+from typing import Any, TypeVar
 
 from pyskoob.http.client import AsyncHTTPClient
 from pyskoob.internal.async_base import AsyncBaseSkoobService
@@ -13,32 +14,157 @@ from pyskoob.models.publisher import (
     PublisherAuthor,
     PublisherItem,
 )
-from pyskoob.parsers.publishers import parse_author, parse_book, parse_stats
-from pyskoob.utils.bs4_utils import (
-    get_tag_attr,
-    get_tag_text,
-    safe_find,
-    safe_find_all,
-)
-from pyskoob.utils.sync_async import maybe_await, run_sync
+from pyskoob.parsers import _lxml_backend as lxml_parser
+from pyskoob.parsers.publishers import parse_publisher_page
+from pyskoob.utils.cache import TTLCache
+from pyskoob.utils.sync_async import collect_pages, gather_bounded
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class _PublisherServiceMixin:
-    """Shared publisher retrieval logic for sync and async services.
+    """URL, caching and pagination helpers shared by the publisher services.
 
-    This mixin expects ``client``, ``base_url`` and ``parse_html`` attributes to
-    be provided by the consuming base classes.
+    Fetching lives on the concrete services so each one calls its client
+    directly. This mixin expects ``client``, ``base_url`` and ``run_parser``
+    attributes to be provided by the consuming base classes.
     """
 
     client: Any
     base_url: str
-    parse_html: Callable[[str], Any]
+    run_parser: Callable[..., Any]
+
+    bulk_concurrency: int = 8
+    """Maximum number of pages fetched at the same time by the ``*_pages`` methods."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Recently parsed publishers, keyed by identifier.
+        self.publisher_cache: TTLCache[Publisher] = TTLCache()
+
+    def clear_cache(self) -> None:
+        """Forget every cached publisher so the next lookup hits Skoob again."""
+        self.publisher_cache.clear()
+
+    def _publisher_url(self, publisher_id: int) -> str:
+        """Return the publisher page URL, logging the upcoming request."""
+        url = f"{self.base_url}/editora/{publisher_id}"
+        logger.debug("Fetching publisher page: %s", url)
+        return url
+
+    def _authors_url(self, publisher_id: int, page: int) -> str:
+        """Return the publisher authors page URL, logging the upcoming request."""
+        url = f"{self.base_url}/editora/autores/{publisher_id}/mpage:{page}"
+        logger.debug("Fetching publisher authors: %s", url)
+        return url
+
+    def _books_url(self, publisher_id: int, page: int) -> str:
+        """Return the publisher books page URL, logging the upcoming request."""
+        url = f"{self.base_url}/editora/livros/{publisher_id}/mpage:{page}"
+        logger.debug("Fetching publisher books: %s", url)
+        return url
+
+    def _listing_args(self, response: Any) -> tuple[str | bytes, str, str | None]:
+        """Return the arguments for the lxml listing parsers.
+
+        The raw body is handed to lxml when possible, saving a decode to
+        ``str`` before parsing.
+        """
+        markup, encoding = lxml_parser.response_markup(response)
+        return markup, self.base_url, encoding
+
+    @staticmethod
+    def _paginate(results: list[T], page: int, has_next_page: bool) -> Pagination[T]:
+        """Wrap one listing page in a :class:`Pagination`."""
+        return Pagination(
+            results=results,
+            limit=len(results),
+            page=page,
+            total=len(results),
+            has_next_page=has_next_page,
+        )
+
+
+class PublisherService(_PublisherServiceMixin, BaseSkoobService):
+    """High level operations for retrieving publishers.
+
+    Requests go straight through the blocking client and pages are parsed
+    inline, without running a coroutine per call.
+    """
+
+    def get_by_id(self, publisher_id: int) -> Publisher:
+        """Synchronous counterpart of :meth:`AsyncPublisherService.get_by_id`."""
+        cached = self.publisher_cache.get(publisher_id)
+        if cached is not None:
+            return cached
+        response = self.client.get(self._publisher_url(publisher_id))
+        response.raise_for_status()
+        publisher = parse_publisher_page(response.text, publisher_id, self.base_url)
+        self.publisher_cache.set(publisher_id, publisher)
+        return publisher
+
+    def get_authors(self, publisher_id: int, page: int = 1) -> Pagination[PublisherAuthor]:
+        """Synchronous counterpart of :meth:`AsyncPublisherService.get_authors`."""
+        response = self.client.get(self._authors_url(publisher_id, page))
+        response.raise_for_status()
+        authors, next_page = lxml_parser.parse_publisher_authors_page(*self._listing_args(response))
+        return self._paginate(authors, page, next_page)
+
+    def get_books(self, publisher_id: int, page: int = 1) -> Pagination[PublisherItem]:
+        """Synchronous counterpart of :meth:`AsyncPublisherService.get_books`."""
+        response = self.client.get(self._books_url(publisher_id, page))
+        response.raise_for_status()
+        books, next_page = lxml_parser.parse_publisher_books_page(*self._listing_args(response))
+        return self._paginate(books, page, next_page)
+
+    def get_authors_pages(self, publisher_id: int, pages: Iterable[int]) -> list[Pagination[PublisherAuthor]]:
+        """Fetch several pages of publisher authors one after another."""
+        return [self.get_authors(publisher_id, page) for page in pages]
+
+    def get_books_pages(self, publisher_id: int, pages: Iterable[int]) -> list[Pagination[PublisherItem]]:
+        """Fetch several pages of publisher books one after another."""
+        return [self.get_books(publisher_id, page) for page in pages]
+
+    def get_all_authors(self, publisher_id: int) -> list[PublisherAuthor]:
+        """Fetch every author of a publisher, following the next-page links."""
+        return self._follow_pages(lambda page: self.get_authors(publisher_id, page))
+
+    def get_all_books(self, publisher_id: int) -> list[PublisherItem]:
+        """Fetch every book of a publisher, following the next-page links."""
+        return self._follow_pages(lambda page: self.get_books(publisher_id, page))
+
+    @staticmethod
+    def _follow_pages(fetch: Callable[[int], Pagination[T]]) -> list[T]:
+        """Fetch pages one after another until one is empty or the last."""
+        results: list[T] = []
+        page = 1
+        while True:
+            listing = fetch(page)
+            results.extend(listing.results)
+            if not listing.results or not listing.has_next_page:
+                logger.info("Collected %s entries from %s pages.", len(results), page)
+                return results
+            page += 1
+
+
+class AsyncPublisherService(_PublisherServiceMixin, AsyncBaseSkoobService):
+    """Asynchronous variant of :class:`PublisherService`.
+
+    Requests are awaited on the async client directly and pages are parsed
+    in :attr:`parse_executor`.
+    """
+
+    def __init__(self, client: AsyncHTTPClient):
+        super().__init__(client)
 
-    async def _get_by_id(self, publisher_id: int) -> Publisher:
+    async def get_by_id(self, publisher_id: int) -> Publisher:
         """Retrieve a publisher by its identifier.
 
+        Results are kept in :attr:`publisher_cache` for five minutes, so
+        repeated lookups of the same publisher skip the request and parsing.
+
         Parameters
         ----------
         publisher_id : int
@@ -55,28 +181,16 @@ class _PublisherServiceMixin:
             If the request returns a non-2xx status code.
         """
 
-        url = f"{self.base_url}/editora/{publisher_id}"
-        logger.info("Fetching publisher page: %s", url)
-        response = await maybe_await(self.client.get, url)
+        cached = self.publisher_cache.get(publisher_id)
+        if cached is not None:
+            return cached
+        response = await self.client.get(self._publisher_url(publisher_id))
         response.raise_for_status()
-        soup = self.parse_html(response.text)
-        name = get_tag_text(safe_find(soup, "h2")) or get_tag_text(soup.title)
-        description = get_tag_text(safe_find(soup, "div", {"id": "historico"}))
-        site_link = soup.find("a", string="Site oficial")
-        website = get_tag_attr(site_link, "href")
-        stats = parse_stats(safe_find(soup, "div", {"id": "vt_estatisticas"}))
-        releases_div = safe_find(soup, "div", {"id": "livros_lancamentos"})
-        releases = [parse_book(div, self.base_url) for div in safe_find_all(releases_div, "div", {"class": "livro-capa-mini"})]
-        return Publisher(
-            id=publisher_id,
-            name=name,
-            description=description,
-            website=website,
-            stats=stats,
-            last_releases=releases,
-        )
+        publisher = await self.run_parser(parse_publisher_page, response.text, publisher_id, self.base_url)
+        self.publisher_cache.set(publisher_id, publisher)
+        return publisher
 
-    async def _get_authors(self, publisher_id: int, page: int = 1) -> Pagination[PublisherAuthor]:
+    async def get_authors(self, publisher_id: int, page: int = 1) -> Pagination[PublisherAuthor]:
         """Retrieve authors associated with a publisher.
 
         Parameters
@@ -92,22 +206,12 @@ class _PublisherServiceMixin:
             Paginated list of publisher authors.
         """
 
-        url = f"{self.base_url}/editora/autores/{publisher_id}/mpage:{page}"
-        logger.info("Fetching publisher authors: %s", url)
-        response = await maybe_await(self.client.get, url)
+        response = await self.client.get(self._authors_url(publisher_id, page))
         response.raise_for_status()
-        soup = self.parse_html(response.text)
-        authors = [parse_author(div, self.base_url) for div in safe_find_all(soup, "div", {"class": "box_autor"})]
-        next_page = bool(safe_find(soup, "div", {"class": "proximo"}))
-        return Pagination(
-            results=authors,
-            limit=len(authors),
-            page=page,
-            total=len(authors),
-            has_next_page=next_page,
-        )
+        authors, next_page = await self.run_parser(lxml_parser.parse_publisher_authors_page, *self._listing_args(response))
+        return self._paginate(authors, page, next_page)
 
-    async def _get_books(self, publisher_id: int, page: int = 1) -> Pagination[PublisherItem]:
+    async def get_books(self, publisher_id: int, page: int = 1) -> Pagination[PublisherItem]:
         """Retrieve books published by a publisher.
 
         Parameters
@@ -123,55 +227,97 @@ class _PublisherServiceMixin:
             Paginated list of books from the publisher.
         """
 
-        url = f"{self.base_url}/editora/livros/{publisher_id}/mpage:{page}"
-        logger.info("Fetching publisher books: %s", url)
-        response = await maybe_await(self.client.get, url)
+        response = await self.client.get(self._books_url(publisher_id, page))
         response.raise_for_status()
-        soup = self.parse_html(response.text)
-        books = [parse_book(div, self.base_url) for div in safe_find_all(soup, "div", {"class": "box_livro"})]
-        next_page = bool(safe_find(soup, "div", {"class": "proximo"}))
-        return Pagination(
-            results=books,
-            limit=len(books),
-            page=page,
-            total=len(books),
-            has_next_page=next_page,
-        )
+        books, next_page = await self.run_parser(lxml_parser.parse_publisher_books_page, *self._listing_args(response))
+        return self._paginate(books, page, next_page)
 
+    async def get_authors_pages(self, publisher_id: int, pages: Iterable[int]) -> list[Pagination[PublisherAuthor]]:
+        """Retrieve several pages of publisher authors concurrently.
 
-class PublisherService(_PublisherServiceMixin, BaseSkoobService):
-    """High level operations for retrieving publishers."""
+        Parameters
+        ----------
+        publisher_id : int
+            Identifier of the publisher.
+        pages : Iterable[int]
+            Result page numbers to fetch.
 
-    def get_by_id(self, publisher_id: int) -> Publisher:
-        """Synchronous wrapper around :meth:`_get_by_id`."""
-        return run_sync(self._get_by_id(publisher_id))
+        Returns
+        -------
+        list[Pagination[PublisherAuthor]]
+            One pagination object per requested page, in input order.
+        """
 
-    def get_authors(self, publisher_id: int, page: int = 1) -> Pagination[PublisherAuthor]:
-        """Synchronous wrapper around :meth:`_get_authors`."""
-        return run_sync(self._get_authors(publisher_id, page))
+        return await gather_bounded((self.get_authors(publisher_id, page) for page in pages), self.bulk_concurrency)
 
-    def get_books(self, publisher_id: int, page: int = 1) -> Pagination[PublisherItem]:
-        """Synchronous wrapper around :meth:`_get_books`."""
-        return run_sync(self._get_books(publisher_id, page))
+    async def get_books_pages(self, publisher_id: int, pages: Iterable[int]) -> list[Pagination[PublisherItem]]:
+        """Retrieve several pages of publisher books concurrently.
 
+        Parameters
+        ----------
+        publisher_id : int
+            Identifier of the publisher.
+        pages : Iterable[int]
+            Result page numbers to fetch.
 
-class AsyncPublisherService(_PublisherServiceMixin, AsyncBaseSkoobService):  # pragma: no cover - thin async wrapper
-    """Asynchronous variant of :class:`PublisherService`."""
+        Returns
+        -------
+        list[Pagination[PublisherItem]]
+            One pagination object per requested page, in input order.
+        """
 
-    def __init__(self, client: AsyncHTTPClient):
-        super().__init__(client)
+        return await gather_bounded((self.get_books(publisher_id, page) for page in pages), self.bulk_concurrency)
 
-    async def get_by_id(self, publisher_id: int) -> Publisher:
-        """Asynchronous wrapper around :meth:`_get_by_id`."""
+    async def get_all_authors(self, publisher_id: int) -> list[PublisherAuthor]:
+        """Retrieve every author of a publisher across all listing pages."""
 
-        return await self._get_by_id(publisher_id)
+        return await collect_pages(lambda page: self.get_authors(publisher_id, page), self.bulk_concurrency)
 
-    async def get_authors(self, publisher_id: int, page: int = 1) -> Pagination[PublisherAuthor]:
-        """Asynchronous wrapper around :meth:`_get_authors`."""
+    async def get_all_books(self, publisher_id: int) -> list[PublisherItem]:
+        """Retrieve every book of a publisher across all listing pages."""
 
-        return await self._get_authors(publisher_id, page)
+        return await collect_pages(lambda page: self.get_books(publisher_id, page), self.bulk_concurrency)
 
-    async def get_books(self, publisher_id: int, page: int = 1) -> Pagination[PublisherItem]:
-        """Asynchronous wrapper around :meth:`_get_books`."""
+    async def _iter_pages(self, fetch: Callable[[int], Coroutine[Any, Any, Pagination[T]]]) -> AsyncIterator[T]:
+        """Yield the entries of a listing, prefetching the next page.
+
+        As soon as a page reports a next-page link the following page is
+        requested in a background task, so the request overlaps with the
+        caller consuming the current entries. Closing the iterator early
+        cancels the pending request.
+
+        Parameters
+        ----------
+        fetch : Callable[[int], Coroutine[Any, Any, Pagination[T]]]
+            Coroutine function returning one page given its number.
+
+        Yields
+        ------
+        T
+            Entries of every page in page order.
+        """
 
-        return await self._get_books(publisher_id, page)
+        number = 1
+        task = asyncio.create_task(fetch(number))
+        try:
+            while True:
+                page = await task
+                if page.has_next_page:
+                    number += 1
+                    task = asyncio.create_task(fetch(number))
+                for item in page.results:
+                    yield item
+                if not page.has_next_page:
+                    return
+        finally:
+            task.cancel()
+
+    def iter_authors(self, publisher_id: int) -> AsyncIterator[PublisherAuthor]:
+        """Iterate over every author of a publisher, prefetching the next page."""
+
+        return self._iter_pages(lambda page: self.get_authors(publisher_id, page))
+
+    def iter_books(self, publisher_id: int) -> AsyncIterator[PublisherItem]:
+        """Iterate over every book of a publisher, prefetching the next page."""
+
+        return self._iter_pages(lambda page: self.get_books(publisher_id, page))
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Callable
-from datetime import datetime
+from collections.abc import Callable, Iterable
 from typing import Any
 
+from bs4 import Tag
+from pydantic import TypeAdapter
+
 from pyskoob.auth import AsyncAuthService, AuthService
 from pyskoob.exceptions import ParsingError
 from pyskoob.http.client import AsyncHTTPClient, SyncHTTPClient
@@ -22,30 +24,124 @@ from pyskoob.models.enums import (
 )
 from pyskoob.models.pagination import Pagination
 from pyskoob.models.user import User, UserBook, UserReadStats, UserSearch
+from pyskoob.parsers import _lxml_backend as lxml_parser
+from pyskoob.parsers import _selectolax_backend as fast_parser
+from pyskoob.parsers.users import parse_user_search_total
 from pyskoob.utils.bs4_utils import (
-    get_tag_attr,
     get_tag_text,
     safe_find,
-    safe_find_all,
-)
-from pyskoob.utils.skoob_parser_utils import (
-    get_book_edition_id_from_url,
-    get_book_id_from_url,
-    get_user_id_from_url,
+    safe_iter_matching,
 )
-from pyskoob.utils.sync_async import maybe_await, run_sync
+from pyskoob.utils.cache import TTLCache
+from pyskoob.utils.fast_json import response_json
+from pyskoob.utils.sync_async import collect_pages, gather_bounded, maybe_await, run_sync
 
 logger = logging.getLogger(__name__)
 
 
+_USER_BOOKS = TypeAdapter(list[UserBook])
+
+_SEARCH_RESULT_STYLE_RE = re.compile(r"border: 1px solid #e4e4e4")
+_USER_HREF_RE = re.compile(r"^/usuario/\d+-")
+_USER_HREF_PARTS_RE = re.compile(r"/usuario/(\d+)-([\w\.\-]+)")
+
+
+def _user_book_fields(user_id: int, entry: dict[str, Any], edition: dict[str, Any]) -> dict[str, Any]:
+    """Map one bookcase API entry and its ``edicao`` to :class:`UserBook` field values."""
+
+    return {
+        "user_id": user_id,
+        "book_id": edition["livro_id"],
+        "edition_id": edition.get("id"),
+        "rating": entry.get("ranking"),
+        "is_favorite": entry.get("favorito"),
+        "is_wishlist": entry.get("desejado"),
+        "is_tradable": entry.get("troco"),
+        "is_owned": entry.get("tenho"),
+        "is_loaned": entry.get("emprestei"),
+        "reading_goal_year": entry.get("meta"),
+        "pages_read": entry.get("paginas_lidas"),
+    }
+
+
 class _UserServiceMixin:
     """Shared user retrieval logic for sync and async services."""
 
     client: Any
     base_url: str
     parse_html: Callable[[str], Any]
+    run_parser: Callable[..., Any]
     _validate_login: Callable[[], Any]
 
+    bulk_concurrency: int = 8
+    """Maximum number of pages fetched at the same time by the ``*_pages`` methods."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Recently fetched profiles and reading stats, keyed by user identifier.
+        self.user_cache: TTLCache[User] = TTLCache(maxsize=1024)
+        self.read_stats_cache: TTLCache[UserReadStats] = TTLCache(maxsize=1024)
+
+    def clear_cache(self) -> None:
+        """Forget every cached user and reading stats so the next lookup hits Skoob again."""
+
+        self.user_cache.clear()
+        self.read_stats_cache.clear()
+
+    def _parse_relations_page(self, response: Any) -> tuple[list[int], bool]:
+        """Parse a relations response into user IDs and the next-page flag.
+
+        lxml is handed the undecoded body when the response exposes it.
+        """
+
+        if fast_parser.fast_parser_enabled():
+            return fast_parser.parse_user_relations_page(response.text)
+        markup, encoding = lxml_parser.response_markup(response)
+        return lxml_parser.parse_user_relations_page(markup, encoding)
+
+    def _parse_reviews_page(self, response: Any, user_id: int) -> tuple[list[BookReview], bool]:
+        """Parse a user reviews response into reviews and the next-page flag.
+
+        lxml is handed the undecoded body when the response exposes it.
+        """
+
+        if fast_parser.fast_parser_enabled():
+            return fast_parser.parse_user_reviews_page(response.text, user_id)
+        markup, encoding = lxml_parser.response_markup(response)
+        return lxml_parser.parse_user_reviews_page(markup, user_id, encoding)
+
+    def _parse_search_page(self, html: str) -> tuple[list[UserSearch], int, bool]:
+        """Parse a user search page into results, the reported total and the next-page flag."""
+
+        if fast_parser.fast_parser_enabled():
+            return fast_parser.parse_user_search_page(html, self.base_url)
+        soup = self.parse_html(html)
+        results = [
+            result
+            for div in safe_iter_matching(soup, "div", "style", _SEARCH_RESULT_STYLE_RE)
+            if (result := self._parse_search_result(div)) is not None
+        ]
+        total = parse_user_search_total(get_tag_text(safe_find(soup, "div", {"class": "contador"})))
+        return results, total, safe_find(soup, "a", {"class": "proximo"}) is not None
+
+    def _parse_search_result(self, div: Tag) -> UserSearch | None:
+        """Build a :class:`UserSearch` from one search result block."""
+
+        anchor = next(safe_iter_matching(div, "a", "href", _USER_HREF_RE), None)
+        if anchor is None:
+            return None  # pragma: no cover - defensive
+        # safe_iter_matching only yields anchors with a string href.
+        href = str(anchor.attrs["href"])
+        match = _USER_HREF_PARTS_RE.search(href)
+        if not match:
+            return None  # pragma: no cover - defensive
+        return UserSearch(
+            id=int(match.group(1)),
+            username=match.group(2),
+            name=anchor.get_text(strip=True),
+            url=f"{self.base_url}{href}",
+        )
+
     async def _get_by_id(self, user_id: int) -> User:
         """Retrieve a user by identifier.
 
@@ -59,6 +155,10 @@ class _UserServiceMixin:
         User
             Parsed user information.
 
+        Notes
+        -----
+        Results are kept in :attr:`user_cache` for five minutes.
+
         Raises
         ------
         FileNotFoundError
@@ -66,11 +166,14 @@ class _UserServiceMixin:
         """
 
         await maybe_await(self._validate_login)
+        cached = self.user_cache.get(user_id)
+        if cached is not None:
+            return cached
         logger.info("Getting user by id: %s", user_id)
         url = f"{self.base_url}/v1/user/{user_id}/stats:true"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        json_data = response.json()
+        json_data = response_json(response)
         if not json_data.get("success"):
             logger.warning("User with ID %s not found.", user_id)
             raise FileNotFoundError(f"User with ID {user_id} not found.")
@@ -78,6 +181,7 @@ class _UserServiceMixin:
         user_data["profile_url"] = self.base_url + user_data["url"]
         user = User.model_validate(user_data)
         logger.info("Successfully retrieved user: '%s'", user.name)
+        self.user_cache.set(user_id, user)
         return user
 
     async def _get_relations(self, user_id: int, relation: UsersRelation, page: int = 1) -> Pagination[int]:
@@ -103,11 +207,8 @@ class _UserServiceMixin:
         logger.info("Getting '%s' for user_id: %s, page: %s", relation.value, user_id, page)
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        soup = self.parse_html(response.text)
         try:
-            users_html = safe_find_all(soup, "div", {"class": "usuarios-mini-lista-txt"})
-            users_id = [int(get_user_id_from_url(get_tag_attr(i.a, "href"))) for i in users_html if i.find("a") and getattr(i, "a", None)]
-            next_page_link = safe_find(soup, "div", {"class": "proximo"})
+            users_id, has_next_page = await maybe_await(self.run_parser, self._parse_relations_page, response)
         except (AttributeError, ValueError, IndexError) as e:  # pragma: no cover - defensive
             logger.exception("Failed to parse user relations: %s", e)
             raise ParsingError("Failed to parse user relations.") from e
@@ -117,7 +218,7 @@ class _UserServiceMixin:
             limit=100,
             page=page,
             total=len(users_id),  # total for this page only
-            has_next_page=bool(next_page_link),
+            has_next_page=has_next_page,
         )
 
     async def _get_reviews(self, user_id: int, page: int = 1) -> Pagination[BookReview]:
@@ -141,44 +242,8 @@ class _UserServiceMixin:
         logger.info("Getting reviews for user_id: %s, page: %s", user_id, page)
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        user_reviews: list[BookReview] = []
-        soup = self.parse_html(response.text)
         try:
-            reviews_html = safe_find_all(soup, "div", {"id": re.compile(r"resenha\d+")})
-            for review_elem in reviews_html:
-                review_id = int(get_tag_attr(review_elem, "id").replace("resenha", ""))
-                book_anchor = safe_find(review_elem, "a", {"href": re.compile(r".*\d+ed\d+.html")})
-                book_url = get_tag_attr(book_anchor, "href")
-                book_id = int(get_book_id_from_url(book_url))
-                edition_id = int(get_book_edition_id_from_url(book_url))
-                star_rating = safe_find(review_elem, "star-rating")
-                rating = float(get_tag_attr(star_rating, "rate", "0"))
-                comment = safe_find(review_elem, "div", {"id": re.compile(r"resenhac\d+")})
-                date_str = get_tag_text(safe_find(comment, "span"))
-                date = None
-                if date_str:
-                    try:
-                        date = datetime.strptime(date_str, "%d/%m/%Y")
-                    except ValueError:
-                        date = None
-                review_text = ""
-                if comment:
-                    span = safe_find(comment, "span")
-                    if span:
-                        siblings = [get_tag_text(sib) for sib in span.next_siblings if hasattr(sib, "get_text")]
-                        review_text = "\n".join(siblings).strip()
-                user_reviews.append(
-                    BookReview(
-                        review_id=review_id,
-                        book_id=book_id,
-                        edition_id=edition_id,
-                        user_id=user_id,
-                        rating=rating,
-                        review_text=review_text,
-                        reviewed_at=date,
-                    )
-                )
-            next_page_link = safe_find(soup, "a", {"string": " Próxima"})
+            user_reviews, has_next_page = await maybe_await(self.run_parser, self._parse_reviews_page, response, user_id)
         except (AttributeError, ValueError, IndexError) as e:  # pragma: no cover - defensive
             logger.exception("Failed to parse user reviews: %s", e)
             raise ParsingError("Failed to parse user reviews.") from e
@@ -188,7 +253,7 @@ class _UserServiceMixin:
             limit=50,
             page=page,
             total=len(user_reviews),  # total for this page only
-            has_next_page=bool(next_page_link),
+            has_next_page=has_next_page,
         )
 
     async def _get_read_stats(self, user_id: int) -> UserReadStats:
@@ -203,14 +268,21 @@ class _UserServiceMixin:
         -------
         UserReadStats
             Reading statistics for the given user.
+
+        Notes
+        -----
+        Results are kept in :attr:`read_stats_cache` for five minutes.
         """
 
         await maybe_await(self._validate_login)
+        cached_stats = self.read_stats_cache.get(user_id)
+        if cached_stats is not None:
+            return cached_stats
         logger.info("Getting read stats for user_id: %s", user_id)
         url = f"{self.base_url}/v1/meta_stats/{user_id}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        json_data = response.json().get("response", {})
+        json_data = response_json(response).get("response", {})
         stats = UserReadStats(
             user_id=user_id,
             year=json_data.get("ano"),
@@ -223,6 +295,7 @@ class _UserServiceMixin:
             ideal_reading_speed=json_data.get("velocidade_ideal"),
         )
         logger.info("Successfully retrieved read stats for user_id: %s", user_id)
+        self.read_stats_cache.set(user_id, stats)
         return stats
 
     async def _get_bookcase(self, user_id: int, bookcase_option: BookcaseOption, page: int = 1) -> Pagination[UserBook]:
@@ -253,26 +326,19 @@ class _UserServiceMixin:
         )
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        json_data = response.json()
+        json_data = response_json(response)
         next_page = json_data.get("paging", {}).get("next_page")
-        results: list[UserBook] = []
-        for r in json_data.get("response", []):
-            edicao = r.get("edicao", {})
-            results.append(
-                UserBook(
-                    user_id=user_id,
-                    book_id=edicao.get("livro_id"),
-                    edition_id=edicao.get("id"),
-                    rating=r.get("ranking"),
-                    is_favorite=r.get("favorito"),
-                    is_wishlist=r.get("desejado"),
-                    is_tradable=r.get("troco"),
-                    is_owned=r.get("tenho"),
-                    is_loaned=r.get("emprestei"),
-                    reading_goal_year=r.get("meta"),
-                    pages_read=r.get("paginas_lidas"),
-                )
-            )
+        # Validating the whole page in one call keeps the per-row work inside
+        # pydantic-core instead of a Python-level constructor call per book.
+        # Entries without an edition cannot become a UserBook; skip them
+        # instead of failing the whole page.
+        results = _USER_BOOKS.validate_python(
+            [
+                _user_book_fields(user_id, r, edition)
+                for r in json_data.get("response", [])
+                if (edition := r.get("edicao")) and "livro_id" in edition
+            ]
+        )
         logger.info("Found %s books on page %s.", len(results), page)
         return Pagination(
             limit=100,
@@ -282,6 +348,64 @@ class _UserServiceMixin:
             page=page,
         )
 
+    async def _get_relations_pages(self, user_id: int, relation: UsersRelation, pages: Iterable[int]) -> list[Pagination[int]]:
+        """Retrieve several pages of related user IDs concurrently.
+
+        Parameters
+        ----------
+        user_id : int
+            Identifier of the source user.
+        relation : UsersRelation
+            Type of relation to retrieve.
+        pages : Iterable[int]
+            Result page numbers to fetch.
+
+        Returns
+        -------
+        list[Pagination[int]]
+            One pagination object per requested page, in input order.
+        """
+
+        return await gather_bounded((self._get_relations(user_id, relation, page) for page in pages), self.bulk_concurrency)
+
+    async def _get_reviews_pages(self, user_id: int, pages: Iterable[int]) -> list[Pagination[BookReview]]:
+        """Retrieve several pages of a user's reviews concurrently.
+
+        Parameters
+        ----------
+        user_id : int
+            Identifier of the user whose reviews will be retrieved.
+        pages : Iterable[int]
+            Result page numbers to fetch.
+
+        Returns
+        -------
+        list[Pagination[BookReview]]
+            One pagination object per requested page, in input order.
+        """
+
+        return await gather_bounded((self._get_reviews(user_id, page) for page in pages), self.bulk_concurrency)
+
+    async def _get_bookcase_pages(self, user_id: int, bookcase_option: BookcaseOption, pages: Iterable[int]) -> list[Pagination[UserBook]]:
+        """Retrieve several pages of a user's bookcase concurrently.
+
+        Parameters
+        ----------
+        user_id : int
+            Identifier of the user whose bookcase will be retrieved.
+        bookcase_option : BookcaseOption
+            Shelf option to fetch.
+        pages : Iterable[int]
+            Result page numbers to fetch.
+
+        Returns
+        -------
+        list[Pagination[UserBook]]
+            One pagination object per requested page, in input order.
+        """
+
+        return await gather_bounded((self._get_bookcase(user_id, bookcase_option, page) for page in pages), self.bulk_concurrency)
+
     async def _search(
         self,
         query: str,
@@ -312,55 +436,22 @@ class _UserServiceMixin:
         """
 
         await maybe_await(self._validate_login)
-        url = f"{self.base_url}/usuario/lista/busca:{query}/mpage:{page}/limit:{limit}"
-        if gender:
-            url += f"/sexo:{gender.value}"
-        if state:
-            url += f"/uf:{state.value}"
+        gender_filter = f"/sexo:{gender.value}" if gender else ""
+        state_filter = f"/uf:{state.value}" if state else ""
+        url = f"{self.base_url}/usuario/lista/busca:{query}/mpage:{page}/limit:{limit}{gender_filter}{state_filter}"
         response = await maybe_await(self.client.get, url)
         response.raise_for_status()
-        soup = self.parse_html(response.text)
         try:
-            user_divs = safe_find_all(
-                soup,
-                "div",
-                attrs={"style": re.compile(r"border: 1px solid #e4e4e4")},
-            )
-            results: list[UserSearch] = []
-            for div in user_divs:
-                anchor = safe_find(div, "a", attrs={"href": re.compile(r"^/usuario/\d+-")})
-                if not anchor:
-                    continue  # pragma: no cover - defensive
-                href = get_tag_attr(anchor, "href")
-                full_url = f"{self.base_url}{href}"
-                match = re.search(r"/usuario/(\d+)-([\w\.\-]+)", href)
-                if not match:
-                    continue  # pragma: no cover - defensive
-                user_id = int(match.group(1))
-                username = match.group(2)
-                name = get_tag_text(anchor)
-                results.append(
-                    UserSearch(
-                        id=user_id,
-                        username=username,
-                        name=name,
-                        url=full_url,
-                    )
-                )
-            total_tag = safe_find(soup, "div", {"class": "contador"})
-            total_text = get_tag_text(total_tag)
-            total = int(total_text.split("encontrados")[0].strip()) if "encontrados" in total_text else 0
-            next_page = safe_find(soup, "a", {"class": "proximo"})
-            has_next = next_page is not None
-            return Pagination[UserSearch](
-                results=results,
-                page=page,
-                total=total,
-                limit=limit,
-                has_next_page=has_next,
-            )
+            results, total, has_next = await maybe_await(self.run_parser, self._parse_search_page, response.text)
         except Exception as e:  # pragma: no cover - defensive
             raise ParsingError("Failed to parse user search results.") from e
+        return Pagination(
+            results=results,
+            page=page,
+            total=total,
+            limit=limit,
+            has_next_page=has_next,
+        )
 
 
 class UserService(_UserServiceMixin, AuthenticatedService):
@@ -396,6 +487,36 @@ class UserService(_UserServiceMixin, AuthenticatedService):
 
         return run_sync(self._get_bookcase(user_id, bookcase_option, page))
 
+    def get_relations_pages(self, user_id: int, relation: UsersRelation, pages: Iterable[int]) -> list[Pagination[int]]:
+        """Fetch several pages of related user IDs one after another."""
+
+        return [self.get_relations(user_id, relation, page) for page in pages]
+
+    def get_reviews_pages(self, user_id: int, pages: Iterable[int]) -> list[Pagination[BookReview]]:
+        """Fetch several pages of a user's reviews one after another."""
+
+        return [self.get_reviews(user_id, page) for page in pages]
+
+    def get_bookcase_pages(self, user_id: int, bookcase_option: BookcaseOption, pages: Iterable[int]) -> list[Pagination[UserBook]]:
+        """Fetch several pages of a user's bookcase one after another."""
+
+        return [self.get_bookcase(user_id, bookcase_option, page) for page in pages]
+
+    def get_all_relations(self, user_id: int, relation: UsersRelation) -> list[int]:
+        """Fetch every related user ID, one page after another."""
+
+        return run_sync(collect_pages(lambda page: self._get_relations(user_id, relation, page), 1))
+
+    def get_all_reviews(self, user_id: int) -> list[BookReview]:
+        """Fetch every review written by a user, one page after another."""
+
+        return run_sync(collect_pages(lambda page: self._get_reviews(user_id, page), 1))
+
+    def get_all_bookcase(self, user_id: int, bookcase_option: BookcaseOption) -> list[UserBook]:
+        """Fetch every book on a bookcase shelf, one page after another."""
+
+        return run_sync(collect_pages(lambda page: self._get_bookcase(user_id, bookcase_option, page), 1))
+
     def search(
         self,
         query: str,
@@ -440,6 +561,36 @@ class AsyncUserService(_UserServiceMixin, AsyncAuthenticatedService):  # pragma:
 
         return await self._get_bookcase(user_id, bookcase_option, page)
 
+    async def get_relations_pages(self, user_id: int, relation: UsersRelation, pages: Iterable[int]) -> list[Pagination[int]]:
+        """Fetch several pages of related user IDs concurrently."""
+
+        return await self._get_relations_pages(user_id, relation, pages)
+
+    async def get_reviews_pages(self, user_id: int, pages: Iterable[int]) -> list[Pagination[BookReview]]:
+        """Fetch several pages of a user's reviews concurrently."""
+
+        return await self._get_reviews_pages(user_id, pages)
+
+    async def get_bookcase_pages(self, user_id: int, bookcase_option: BookcaseOption, pages: Iterable[int]) -> list[Pagination[UserBook]]:
+        """Fetch several pages of a user's bookcase concurrently."""
+
+        return await self._get_bookcase_pages(user_id, bookcase_option, pages)
+
+    async def get_all_relations(self, user_id: int, relation: UsersRelation) -> list[int]:
+        """Fetch every related user ID, ``bulk_concurrency`` pages at a time."""
+
+        return await collect_pages(lambda page: self._get_relations(user_id, relation, page), self.bulk_concurrency)
+
+    async def get_all_reviews(self, user_id: int) -> list[BookReview]:
+        """Fetch every review written by a user, ``bulk_concurrency`` pages at a time."""
+
+        return await collect_pages(lambda page: self._get_reviews(user_id, page), self.bulk_concurrency)
+
+    async def get_all_bookcase(self, user_id: int, bookcase_option: BookcaseOption) -> list[UserBook]:
+        """Fetch every book on a bookcase shelf, ``bulk_concurrency`` pages at a time."""
+
+        return await collect_pages(lambda page: self._get_bookcase(user_id, bookcase_option, page), self.bulk_concurrency)
+
     async def search(
         self,
         query: str,
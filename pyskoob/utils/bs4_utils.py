@@ -1,10 +1,40 @@
 """Utilities for working safely with BeautifulSoup elements."""
 
+import re
+from collections.abc import Iterator
 from typing import Any
 
 from bs4 import BeautifulSoup, Tag
 from bs4.element import PageElement
 
+HTML_PARSER = "lxml"
+"""Tree builder used for every page parsed by the services."""
+
+
+def parse_html(content: str) -> BeautifulSoup:
+    """
+    Parses HTML content into a BeautifulSoup object.
+
+    The ``lxml`` tree builder is used because it builds the tree in C and is
+    several times faster than the pure-Python ``html.parser``.
+
+    Parameters
+    ----------
+    content : str
+        The HTML content to parse.
+
+    Returns
+    -------
+    BeautifulSoup
+        The parsed document.
+
+    Examples
+    --------
+    >>> parse_html('<p>hi</p>').p.text
+    'hi'
+    """
+    return BeautifulSoup(content, HTML_PARSER)
+
 
 def safe_find(soup: BeautifulSoup | Tag | None, name: str, attrs: dict | None = None) -> Tag | None:
     """
@@ -66,6 +96,81 @@ def safe_find_all(soup: BeautifulSoup | Tag | None, name: str, attrs: dict | Non
     return [tag for tag in all_found if isinstance(tag, Tag)]
 
 
+def safe_iter_all(soup: BeautifulSoup | Tag | None, name: str, class_: str | None = None) -> Iterator[Tag]:
+    """
+    Lazily yields descendant Tags by name and, optionally, CSS class.
+
+    Unlike :func:`safe_find_all` no result list is built, so callers that
+    stop early skip the rest of the tree. The plain name/class test is also
+    several times cheaper than BeautifulSoup's generic attribute matching.
+
+    Parameters
+    ----------
+    soup : BeautifulSoup | Tag | None
+        The BeautifulSoup object or Tag to search in.
+    name : str
+        The name of the tags to yield.
+    class_ : str | None, optional
+        A CSS class the tags must carry, by default None.
+
+    Yields
+    ------
+    Tag
+        Matching Tags in document order.
+
+    Examples
+    --------
+    >>> soup = BeautifulSoup('<p class="a b">x</p><p>y</p>', 'html.parser')
+    >>> [p.text for p in safe_iter_all(soup, 'p', 'b')]
+    ['x']
+    """
+    if soup is None:
+        return
+    for element in soup.descendants:
+        if isinstance(element, Tag) and element.name == name and (class_ is None or class_ in element.get_attribute_list("class")):
+            yield element
+
+
+def safe_iter_matching(soup: BeautifulSoup | Tag | None, name: str, attr: str, pattern: re.Pattern[str]) -> Iterator[Tag]:
+    """
+    Lazily yields descendant Tags whose ``attr`` value matches ``pattern``.
+
+    Equivalent to ``safe_find_all(soup, name, {attr: pattern})`` for
+    single-valued attributes such as ``id`` or ``href``, but skips
+    BeautifulSoup's generic attribute matching.
+
+    Parameters
+    ----------
+    soup : BeautifulSoup | Tag | None
+        The BeautifulSoup object or Tag to search in.
+    name : str
+        The name of the tags to yield.
+    attr : str
+        The attribute to test.
+    pattern : re.Pattern[str]
+        Pattern searched for in the attribute value.
+
+    Yields
+    ------
+    Tag
+        Matching Tags in document order.
+
+    Examples
+    --------
+    >>> soup = BeautifulSoup('<a href="/a1">x</a><a>y</a><a href="/b">z</a>', 'html.parser')
+    >>> [a.text for a in safe_iter_matching(soup, 'a', 'href', re.compile(r'\\d'))]
+    ['x']
+    """
+    if soup is None:
+        return
+    search = pattern.search
+    for element in soup.descendants:
+        if type(element) is Tag and element.name == name:
+            value = element.attrs.get(attr)
+            if type(value) is str and search(value):
+                yield element
+
+
 def get_tag_text(tag: PageElement | None, strip: bool = True) -> str:
     """
     Gets the text of a Tag, returning an empty string if the tag is None.
@@ -87,7 +192,8 @@ def get_tag_text(tag: PageElement | None, strip: bool = True) -> str:
     >>> get_tag_text(BeautifulSoup('<p>Hi</p>', 'html.parser').p)
     'Hi'
     """
-    if tag:
+    # ``is not None`` avoids dispatching to ``Tag.__bool__`` on every call.
+    if tag is not None:
         return tag.get_text(strip=strip)
     return ""
 
@@ -116,6 +222,6 @@ def get_tag_attr(tag: Tag | None, attr: str, default: Any = None) -> Any:
     >>> get_tag_attr(tag, 'href')
     '/'
     """
-    if tag:
+    if tag is not None:
         return tag.get(attr, default)
     return default
@@ -0,0 +1,64 @@
+"""JSON decoding helpers for HTTP responses.
+
+When :mod:`orjson` is installed (it ships with the ``fast`` extra) response
+bodies are decoded with it straight from the raw bytes, skipping the text
+decoding step and the slower standard library decoder. Otherwise the
+response's own ``json()`` method is used.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyskoob.http.client import HTTPResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
+def response_json(response: HTTPResponse) -> Any:
+    """Decode the JSON body of ``response``.
+
+    Parameters
+    ----------
+    response : HTTPResponse
+        Response whose body contains JSON.
+
+    Returns
+    -------
+    Any
+        The decoded JSON document.
+
+    Raises
+    ------
+    ValueError
+        If the body is not valid JSON. ``orjson.JSONDecodeError`` is a
+        subclass of :class:`ValueError`.
+    """
+
+    if HAS_ORJSON:
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return orjson.loads(content)
+    return response.json()
+
+
+def response_success(response: HTTPResponse) -> bool:
+    """Return the ``success`` flag of a Skoob API response.
+
+    Parameters
+    ----------
+    response : HTTPResponse
+        Response from one of the ``/v1`` profile endpoints.
+
+    Returns
+    -------
+    bool
+        ``True`` when the payload reports success, ``False`` otherwise.
+    """
+
+    return bool(response_json(response).get("success", False))
@@ -7,7 +7,16 @@ authors from their respective Skoob links.
 from __future__ import annotations
 
 import re
-from urllib.parse import urlparse
+
+# Scheme and authority of an absolute URL (RFC 3986, appendix B). Matching
+# them in the same pattern as the identifier confines the search to the path
+# without splitting the URL first. The group is atomic so a failed path match
+# cannot backtrack into the host, e.g. the "2" of ``https://www2.skoob.com.br``.
+_URL_PREFIX = r"^(?>(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?(?://[^/?#]*)?)"
+_BOOK_ID_RE = re.compile(_URL_PREFIX + r"[^?#\d]*(\d+)")
+_EDITION_ID_RE = re.compile(_URL_PREFIX + r"[^?#]*?ed(\d+)")
+_USER_ID_RE = re.compile(_URL_PREFIX + r"[^?#]*?/usuario/(\d+)")
+_AUTHOR_ID_RE = re.compile(_URL_PREFIX + r"[^?#]*?/autor/(\d+)")
 
 
 def get_book_id_from_url(url: str) -> str:
@@ -33,8 +42,7 @@ def get_book_id_from_url(url: str) -> str:
     >>> get_book_id_from_url('https://www.skoob.com.br/livro/1-ed1.html')
     '1'
     """
-    path = urlparse(url).path
-    match = re.search(r"(\d+)", path)
+    match = _BOOK_ID_RE.match(url)
     if not match:
         raise ValueError(f"Book ID not found in URL: {url}")  # pragma: no cover - invalid URL
     return match.group(1)
@@ -63,8 +71,7 @@ def get_book_edition_id_from_url(url: str) -> str:
     >>> get_book_edition_id_from_url('https://www.skoob.com.br/livro/1-ed10.html')
     '10'
     """
-    path = urlparse(url).path
-    match = re.search(r"ed(\d+)", path)
+    match = _EDITION_ID_RE.match(url)
     if not match:
         raise ValueError(f"Book edition ID not found in URL: {url}")  # pragma: no cover - invalid URL
     return match.group(1)
@@ -93,8 +100,7 @@ def get_user_id_from_url(url: str) -> str:
     >>> get_user_id_from_url('https://www.skoob.com.br/usuario/5-name')
     '5'
     """
-    path = urlparse(url).path
-    match = re.search(r"/usuario/(\d+)", path)
+    match = _USER_ID_RE.match(url)
     if not match:
         raise ValueError(f"User ID not found in URL: {url}")  # pragma: no cover - invalid URL
     return match.group(1)
@@ -123,8 +129,7 @@ def get_author_id_from_url(url: str) -> str:
     >>> get_author_id_from_url('https://www.skoob.com.br/autor/50-name')
     '50'
     """
-    path = urlparse(url).path
-    match = re.search(r"/autor/(\d+)", path)
+    match = _AUTHOR_ID_RE.match(url)
     if not match:
         raise ValueError(f"Author ID not found in URL: {url}")  # pragma: no cover - invalid URL
     return match.group(1)
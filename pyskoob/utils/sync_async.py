@@ -8,9 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from collections.abc import Callable, Coroutine
+import logging
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from typing import Any, TypeVar
 
+from pyskoob.models.pagination import Pagination
+
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
@@ -48,3 +53,103 @@ def run_sync(awaitable: Coroutine[Any, Any, T]) -> T:
         )
 
     return asyncio.run(awaitable)
+
+
+async def gather_bounded(calls: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """Await ``calls`` concurrently, keeping at most ``limit`` in flight.
+
+    Parameters
+    ----------
+    calls : Iterable[Awaitable[T]]
+        Pending operations to run.
+    limit : int
+        Maximum number of operations awaited at the same time.
+
+    Returns
+    -------
+    list[T]
+        Results in the same order as ``calls``.
+
+    Raises
+    ------
+    Exception
+        The first error raised by any call. The remaining calls are cancelled
+        and awaited before it propagates, so none keeps running in the
+        background and calls still waiting for a slot never start.
+    """
+
+    semaphore = asyncio.Semaphore(limit)
+    failed = False
+
+    async def bounded(call: Awaitable[T]) -> T:
+        nonlocal failed
+        try:
+            async with semaphore:
+                # A failed call frees its slot before the error reaches the gather below.
+                if failed:
+                    raise asyncio.CancelledError
+                try:
+                    return await call
+                except BaseException:
+                    failed = True
+                    raise
+        finally:
+            if inspect.iscoroutine(call):
+                # Close calls cancelled before they started to avoid "never awaited" warnings.
+                call.close()
+
+    tasks = [asyncio.ensure_future(bounded(call)) for call in calls]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def collect_pages(fetch: Callable[[int], Awaitable[Pagination[T]]], window: int) -> list[T]:
+    """Collect the results of every page of a listing, ``window`` pages at a time.
+
+    Skoob listings do not say how many pages they have, so pages are
+    requested in windows of ``window`` and collection stops at the first page
+    that is empty or has no next page. Pages requested past that point are
+    discarded, including any error they raised.
+
+    Parameters
+    ----------
+    fetch : Callable[[int], Awaitable[Pagination[T]]]
+        Returns one page given its 1-based number.
+    window : int
+        Number of pages requested concurrently; ``1`` fetches one page at a
+        time and never requests past the last page.
+
+    Returns
+    -------
+    list[T]
+        Results of all pages in page order.
+
+    Raises
+    ------
+    Exception
+        Whatever ``fetch`` raised for a page inside the listing.
+    """
+
+    async def attempt(number: int) -> Pagination[T] | BaseException:
+        try:
+            return await fetch(number)
+        except Exception as exc:
+            return exc
+
+    results: list[T] = []
+    start = 1
+    while True:
+        for number, page in enumerate(await gather_bounded(map(attempt, range(start, start + window)), window), start):
+            if isinstance(page, BaseException):
+                # The previous page announced this one, so the failure is real.
+                raise page
+            results.extend(page.results)
+            if not page.results or not page.has_next_page:
+                logger.info("Collected %s entries from %s pages.", len(results), number)
+                return results
+        start += window
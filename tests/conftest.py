@@ -1,3 +1,6 @@
+import asyncio
+import re
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, cast
 
@@ -64,6 +67,51 @@ class DummyAsyncClient:
         pass
 
 
+class PagedClient(DummyClient):
+    """Serve numbered listing pages rendered by ``render(number, has_next)``.
+
+    The page number is read from the ``page:<n>`` segment of the URL and every
+    page before ``last_page`` links to the next one.
+    """
+
+    def __init__(self, last_page: int, render: Callable[[int, bool], str]):
+        super().__init__()
+        self.last_page = last_page
+        self.render = render
+
+    def get(self, url: str, **kwargs: Any) -> DummyResponse:
+        match = re.search(r"page:(\d+)", url)
+        assert match, url
+        number = int(match.group(1))
+        self.text = self.render(number, number < self.last_page)
+        return super().get(url, **kwargs)
+
+
+class AsyncDummyClient:
+    """Await a synchronous stub client, recording how many calls overlap."""
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def called(self) -> list[Any]:
+        return self.client.called
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.client.get(url, **kwargs)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
 @pytest.fixture
 def dummy_client() -> DummyClient:
     return DummyClient()
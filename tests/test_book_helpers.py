@@ -7,11 +7,16 @@ from conftest import DummyClient
 
 from pyskoob.books import BookService
 from pyskoob.http.client import SyncHTTPClient
+from pyskoob.parsers._lxml_backend import parse_readers_page
 from pyskoob.parsers.books import (
     extract_edition_id_from_reviews_page,
+    extract_img_url,
     extract_publisher_and_isbn,
     extract_review_date_and_text,
-    extract_user_ids_from_html,
+    iter_reviews,
+    normalize_img_url,
+    parse_review_date,
+    split_publisher_and_isbn,
 )
 
 
@@ -52,9 +57,8 @@ def test_extract_user_ids_and_edition_id():
         "<div class='livro-leitor-container'><span>No link</span></div>"
     )
     service, _ = make_service()
-    soup = BeautifulSoup(html_users, "html.parser")
-    ids = extract_user_ids_from_html(soup)
-    assert ids == [1, 2]
+    assert parse_readers_page(html_users) == ([1, 2], False)
+    assert parse_readers_page("<div class='livro-leitor-container'><a href='/perfil/x'></a></div>") == ([], False)
 
     html_reviews = "<div id='pg-livro-menu-principal-container'><a href='/livro/10-ed5.html'></a></div>"
     soup = BeautifulSoup(html_reviews, "html.parser")
@@ -69,6 +73,9 @@ def test_extract_user_ids_and_edition_id():
         ("<div id='c'><span>01/01/2020</span>Great</div>", datetime(2020, 1, 1), "Great"),
         ("<div id='c'><span>bad</span>Nice</div>", None, "Nice"),
         ("<div id='c'>Only</div>", None, "Only"),
+        ("<div id='c'><span>bad</span></div>", None, "bad"),
+        ("<div id='c'><span>01/01/2020</span>A<p>B <b>C</b></p></div>", datetime(2020, 1, 1), "A\nB\nC"),
+        ("<div id='c'><p><span>01/01/2020</span>A</p><p>B</p></div>", datetime(2020, 1, 1), "A"),
     ],
 )
 def test_extract_review_date_and_text(html, date, text):
@@ -77,3 +84,78 @@ def test_extract_review_date_and_text(html, date, text):
     result_date, result_text = extract_review_date_and_text(soup.div, 1)
     assert result_date == date
     assert result_text == text
+
+
+def test_iter_reviews_skips_invalid_blocks():
+    html = (
+        "<div id='resenha1'><a href='/usuario/5-user'></a><star-rating rate='4'></star-rating>"
+        "<div id='resenhac1'><span>01/01/2020</span>Nice</div></div>"
+        "<div id='resenha2'><p>no user link</p></div>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    reviews = iter_reviews(soup, 10, 20)
+    assert iter(reviews) is reviews
+    parsed = list(reviews)
+    assert [r.review_id for r in parsed] == [1]
+    assert parsed[0].user_id == 5 and parsed[0].rating == 4.0
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("05/03/2021", datetime(2021, 3, 5)),
+        ("5/3/2021", datetime(2021, 3, 5)),
+        ("05/3/2021", datetime(2021, 3, 5)),
+        ("5/3/21", None),
+        ("005/03/2021", None),
+        ("31/02/2021", None),
+        ("+1/01/2020", None),
+        ("ab/cd/efgh", None),
+        ("", None),
+    ],
+)
+def test_parse_review_date(text, expected):
+    assert parse_review_date(text) == expected
+
+
+@pytest.mark.parametrize(
+    "src,expected",
+    [
+        ("//img.skoob.com.br/a.jpg", "https://img.skoob.com.br/a.jpg"),
+        ("https://img/x.jpg", "https://img/x.jpg"),
+        ("http://img/x.jpg?v=1", "http://img/x.jpg?v=1"),
+        ("HTTPS://img/x.jpg", "https://img/x.jpg"),
+        ("https:///x.jpg", ""),
+        ("/relative.jpg", ""),
+        ("", ""),
+    ],
+)
+def test_extract_img_url(src, expected):
+    assert extract_img_url(src) == expected
+
+
+@pytest.mark.parametrize(
+    "texts,expected",
+    [
+        (["123456789", "Pub"], ("Pub", "123456789")),
+        (["12345678", "Pub"], ("Pub", None)),
+        (["B0ABC12345"], (None, "B0ABC12345")),
+        (["B0abc12345"], (None, None)),
+        (["B0ABC-2345"], (None, None)),
+        ([], (None, None)),
+    ],
+)
+def test_split_publisher_and_isbn(texts, expected):
+    assert split_publisher_and_isbn(texts) == expected
+
+
+def test_split_publisher_and_isbn_shares_publisher_strings():
+    first, _ = split_publisher_and_isbn(["123456789", "".join(["Edi", "tora"])])
+    second, _ = split_publisher_and_isbn(["987654321", "".join(["Edit", "ora"])])
+    assert first is second
+
+
+def test_extract_img_url_from_tag():
+    soup = BeautifulSoup("<a><img src='//img/x.jpg'></a><b></b>", "html.parser")
+    assert extract_img_url(soup.a) == normalize_img_url("//img/x.jpg") == "https://img/x.jpg"
+    assert extract_img_url(soup.b) == ""
@@ -1,3 +1,5 @@
+import re
+
 from bs4 import BeautifulSoup
 
 from pyskoob.utils import bs4_utils
@@ -42,3 +44,22 @@ def test_safe_find_handles_falsy_soup() -> None:
     assert tag is not None and tag.text == "hello"
     tags = bs4_utils.safe_find_all(falsy_soup, "p")
     assert len(tags) == 1 and tags[0].text == "hello"
+
+
+def test_safe_iter_all_is_lazy_and_matches_class_tokens() -> None:
+    soup = BeautifulSoup('<div class="a b"><span>1</span></div><div class="ab">2</div><div class="b">3</div>', "html.parser")
+    found = bs4_utils.safe_iter_all(soup, "div", "b")
+    assert not isinstance(found, list)
+    assert [d.get_text() for d in found] == ["1", "3"]
+    assert [s.get_text() for s in bs4_utils.safe_iter_all(soup, "span")] == ["1"]
+    assert list(bs4_utils.safe_iter_all(None, "div")) == []
+
+
+def test_safe_iter_matching_agrees_with_find_all() -> None:
+    pattern = re.compile(r"resenha\d+")
+    html = "<div id='resenha1'><div id='resenhac1'></div><div id='xresenha2'></div></div><div></div><p id='resenha3'></p>"
+    soup = BeautifulSoup(html, "lxml")
+    found = bs4_utils.safe_iter_matching(soup, "div", "id", pattern)
+    assert not isinstance(found, list)
+    assert list(found) == bs4_utils.safe_find_all(soup, "div", {"id": pattern})
+    assert list(bs4_utils.safe_iter_matching(None, "div", "id", pattern)) == []
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from pyskoob.utils import cache as cache_module
+from pyskoob.utils.cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache: TTLCache[str] = TTLCache(ttl=10)
+    cache.set(1, "x")
+    now[0] = 109.9
+    assert cache.get(1) == "x"
+    now[0] = 110.0
+    assert cache.get(1) is None
+    assert len(cache) == 0
@@ -0,0 +1,31 @@
+import pytest
+
+from pyskoob.utils import fast_json
+from pyskoob.utils.fast_json import response_json, response_success
+
+
+class BytesResponse:
+    content = b'{"success": true, "response": [1, 2]}'
+
+    def json(self):
+        return {"success": False}
+
+
+class JsonOnlyResponse:
+    def json(self):
+        return {"success": 1}
+
+
+def test_response_json_prefers_raw_bytes():
+    pytest.importorskip("orjson")
+    assert response_json(BytesResponse()) == {"success": True, "response": [1, 2]}
+
+
+def test_response_json_without_orjson(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(fast_json, "HAS_ORJSON", False)
+    assert response_success(BytesResponse()) is False
+
+
+def test_response_json_without_content():
+    assert response_json(JsonOnlyResponse()) == {"success": 1}
+    assert response_success(JsonOnlyResponse()) is True
@@ -1,8 +1,10 @@
 import asyncio
 
 import httpx
+import pytest
 
-from pyskoob.http.httpx import HttpxAsyncClient
+from pyskoob.http import httpx as httpx_module
+from pyskoob.http.httpx import DEFAULT_LIMITS, HttpxAsyncClient, HttpxSyncClient
 
 
 def test_async_client_get_post_aclose():
@@ -38,3 +40,22 @@ def test_async_client_context_manager_closes():
         assert client._client.is_closed
 
     asyncio.run(main())
+
+
+@pytest.mark.parametrize("has_http2", [True, False])
+def test_clients_apply_connection_defaults(monkeypatch: pytest.MonkeyPatch, has_http2: bool) -> None:
+    captured: list[dict] = []
+
+    class Recorder:
+        def __init__(self, **kwargs):
+            captured.append(kwargs)
+
+    monkeypatch.setattr(httpx_module, "HAS_HTTP2", has_http2)
+    monkeypatch.setattr(httpx_module.httpx, "Client", Recorder)
+    monkeypatch.setattr(httpx_module.httpx, "AsyncClient", Recorder)
+    HttpxSyncClient()
+    HttpxAsyncClient(limits=httpx.Limits(max_connections=1), http2=False)
+    assert captured[0]["limits"] is DEFAULT_LIMITS
+    assert captured[0].get("http2", False) is has_http2
+    assert captured[1]["limits"].max_connections == 1
+    assert captured[1]["http2"] is False
@@ -0,0 +1,168 @@
+from typing import cast
+
+import pytest
+from bs4 import BeautifulSoup
+
+from pyskoob.http.client import HTTPResponse
+from pyskoob.models.publisher import PublisherAuthor
+from pyskoob.parsers._lxml_backend import (
+    parse_publisher_authors_page,
+    parse_publisher_books_page,
+    parse_readers_page,
+    parse_user_relations_page,
+    parse_user_reviews_page,
+    response_markup,
+)
+from pyskoob.parsers.publishers import parse_book
+
+READERS_HTML = (
+    "<div class='livro-leitor-container'><a href='/usuario/7-ana'></a><a href='/usuario/99-x'></a></div>"
+    "<div class='livro-leitor-container extra'><span><a href='/usuario/8-bia'>Bia</a></span></div>"
+    "<div class='livro-leitor-container'><a href='/bad'></a></div>"
+    "<div class='livro-leitor-container'><p>no link</p></div>"
+    "<a class='btn proximo' href='/next'>next</a>"
+)
+
+
+def test_parse_readers_page_matches_bs4():
+    ids, has_next = parse_readers_page(READERS_HTML)
+    assert ids == [7, 8]
+    assert has_next is True
+
+
+def test_parse_readers_page_empty():
+    assert parse_readers_page("") == ([], False)
+    assert parse_readers_page("<p>nothing</p>") == ([], False)
+
+
+def test_parse_readers_page_ignores_links_outside_containers():
+    html = (
+        '<style>.livro-leitor-container{}</style><a href="/usuario/2-me">me</a>'
+        '<div class="livro-leitor-container"><a href="/usuario/7-ana"><img></a></div>'
+        '<div class="livro-leitor-container"><p>no link</p></div>'
+        '<div class="livro-leitor-container-extra"><a href="/usuario/9-no">x</a></div>'
+        '<footer><a href="/usuario/1-me">me</a></footer>'
+    )
+    assert parse_readers_page(html) == ([7], False)
+
+
+PUBLISHER_BOOKS_HTML = (
+    "<div class='box_livro'><a href='/b1' title='B'><img src='b.jpg'></a></div>"
+    "<div class='row box_livro'><p><a href='/b2' title='C'><span><img src='c.jpg'></span></a></p></div>"
+    "<div class='box_livro_extra'><a href='/x' title='X'><img src='x.jpg'></a></div>"
+    "<div class='btn proximo'></div>"
+)
+
+
+def test_parse_publisher_books_page_matches_bs4():
+    books, has_next = parse_publisher_books_page(PUBLISHER_BOOKS_HTML, "https://s")
+    soup = BeautifulSoup(PUBLISHER_BOOKS_HTML, "lxml")
+    assert books == [parse_book(div, "https://s") for div in soup.find_all("div", class_="box_livro")]
+    assert [b.url for b in books] == ["https://s/b1", "https://s/b2"]
+    assert has_next is True
+
+
+def test_parse_publisher_authors_page_matches_bs4():
+    html = "<div class='box_autor'><a href='/a1'><img src='a.jpg'></a><h3> Ana <b>Lu</b> </h3></div>"
+    authors, has_next = parse_publisher_authors_page(html, "https://s")
+    assert authors == [PublisherAuthor(url="https://s/a1", name="AnaLu", img_url="a.jpg")]
+    assert has_next is False
+
+
+def test_parse_publisher_pages_default_missing_fields():
+    books, _ = parse_publisher_books_page("<div class='box_livro'><a href='/b1'></a></div>", "")
+    assert (books[0].title, books[0].img_url) == ("", "")
+    assert parse_publisher_authors_page("", "") == ([], False)
+
+
+def test_parse_publisher_pages_skip_blocks_without_link():
+    books, _ = parse_publisher_books_page(
+        "<div class='box_livro'><img src='b.jpg'></div><div class='box_livro'><a>x</a></div>", "https://s"
+    )
+    authors, _ = parse_publisher_authors_page("<div class='box_autor'><h3>Ana</h3></div>", "https://s")
+    assert books == authors == []
+
+
+def test_publisher_pages_parse_undecoded_bytes():
+    html = "<div class='box_livro'><a href='/b1' title='Coração'><img src='b.jpg'></a></div>"
+    books, _ = parse_publisher_books_page(html.encode(), "", None)
+    assert books[0].title == "Coração"
+    books, _ = parse_publisher_books_page(html.encode("latin-1"), "", "latin-1")
+    assert books[0].title == "Coração"
+
+
+def test_response_markup_prefers_raw_content():
+    class Raw:
+        text = "<p>text</p>"
+        content = b"<p>bytes</p>"
+        encoding = "utf-8"
+
+    class TextOnly:
+        text = "<p>text</p>"
+
+    assert response_markup(cast(HTTPResponse, Raw())) == (b"<p>bytes</p>", "utf-8")
+    assert response_markup(cast(HTTPResponse, TextOnly())) == ("<p>text</p>", None)
+
+
+@pytest.mark.parametrize(
+    "comment,expected",
+    [
+        ("<span>01/01/2020</span> A <p>B <b>C</b></p><br><!-- x --><script>s()</script>", "A\nB\nC"),
+        ("Por <span>01/01/2020</span>A", "A"),
+        ("<p><span>01/01/2020</span>A</p>B", "A"),
+        ("<span>01/01/2020</span>", ""),
+    ],
+)
+def test_parse_user_reviews_page_review_text(comment, expected):
+    html = f"<div id='resenha1'><a href='/livro/1ed2.html'></a><div id='resenhac1'>{comment}</div></div>"
+    (review,), has_next = parse_user_reviews_page(html.encode(), 5, "utf-8")
+    assert review.review_text == expected
+    assert review.reviewed_at is not None
+    assert has_next is False
+
+
+@pytest.mark.parametrize(
+    "link,expected",
+    [
+        ("<a href='/n'> Próxima</a>", True),
+        ("<a href='/n'><b> Próxima</b></a>", True),
+        ("<a href='/n'> Próxima <b>»</b></a>", False),
+        ("<span> Próxima</span>", False),
+    ],
+)
+def test_parse_user_reviews_page_next_link(link, expected):
+    assert parse_user_reviews_page(f"<p>x</p>{link}", 5) == ([], expected)
+
+
+def test_parse_user_relations_page():
+    html = (
+        "<div class='usuarios-mini-lista-txt'><span><a href='/usuario/20-joão'>João</a></span><a href='/usuario/21-x'></a></div>"
+        "<div class='usuarios-mini-lista-txt'>no link</div>"
+        "<div class='row usuarios-mini-lista-txt'><a href='/usuario/22-jane'>Jane</a></div>"
+        "<div class='proximo'></div>"
+    )
+    assert parse_user_relations_page(html) == parse_user_relations_page(html.encode("cp1252"), "cp1252") == ([20, 22], True)
+    assert parse_user_relations_page("") == ([], False)
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        (b"<html><body><p>Nenhum usu\xe1rio</p></body></html>", ([], False)),
+        (b"<div class='proximo'></div>", ([], True)),
+    ],
+)
+def test_parse_user_relations_page_without_entries(html, expected):
+    assert parse_user_relations_page(html, "cp1252") == expected
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        ("<p>Nenhuma resenha</p>", ([], False)),
+        ("<p>vazio</p>", ([], False)),
+        ("<a href='/p2'> Pr&oacute;xima</a>", ([], True)),
+    ],
+)
+def test_parse_user_reviews_page_without_entries(html, expected):
+    assert parse_user_reviews_page(html, 1) == parse_user_reviews_page(html.encode(), 1) == expected
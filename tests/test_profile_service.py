@@ -74,3 +74,18 @@ def test_label_and_status_methods():
 def test_change_book_shelf_failure():
     service, _ = make_service(False)
     assert service.change_book_shelf(1, BookShelf.BOOK) is False
+
+
+def test_bulk_methods_preserve_order():
+    service, client = make_service(True)
+    assert service.add_book_labels([(1, BookLabel.FAVORITE), (2, BookLabel.WISHLIST)]) == [True, True]
+    assert service.update_book_statuses([(3, BookStatus.READ)]) == [True]
+    assert service.rate_books([(4, 4.5), (5, 2)]) == [True, True]
+    assert [url.rsplit("/", 2)[-2] for url in client.called] == ["1", "2", "3", "4", "5"]
+
+
+def test_rate_books_validates_before_sending():
+    service, client = make_service(True)
+    with pytest.raises(ValueError):
+        service.rate_books([(1, 4), (2, 7)])
+    assert client.called == []
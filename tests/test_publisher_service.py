@@ -1,7 +1,17 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from typing import cast
 
-from pyskoob.http.client import SyncHTTPClient
-from pyskoob.publishers import PublisherService
+import pytest
+from bs4 import BeautifulSoup
+from conftest import AsyncDummyClient, PagedClient
+
+from pyskoob import publishers as publishers_module
+from pyskoob.http.client import AsyncHTTPClient, SyncHTTPClient
+from pyskoob.parsers.publishers import extract_website, parse_stats
+from pyskoob.publishers import AsyncPublisherService, PublisherService
+from pyskoob.utils.bs4_utils import get_tag_attr
 
 
 class DummyClient:
@@ -71,3 +81,125 @@ def test_get_authors_and_books():
     books = service.get_books(1)
     assert books.results[0].title == "B"
     assert books.has_next_page is True
+
+
+def test_listing_pages_skip_unrelated_markup():
+    html = (
+        "<ul><li><div class='box_livro'>nested</div></li></ul>"
+        "<div class='row box_autor'><a href='/a1'><img src='a.jpg'></a><h3>A</h3></div>"
+        "<div class='box_autor_extra'><h3>X</h3></div>"
+    )
+    service, _ = make_service(html)
+    res = service.get_authors(1)
+    assert [a.name for a in res.results] == ["A"]
+    assert res.has_next_page is False
+
+
+def test_get_books_pages_preserves_page_order():
+    service, client = make_service("<div class='box_livro'><a href='/b1' title='B'><img src='b.jpg'></a></div>")
+    pages = service.get_books_pages(1, [3, 1, 2])
+    assert [p.page for p in pages] == [3, 1, 2]
+    assert [url.rsplit(":", 1)[-1] for url in client.called] == ["3", "1", "2"]
+    assert service.get_authors_pages(1, []) == []
+
+
+def test_get_by_id_is_cached_until_cleared():
+    service, client = make_service("<h2>Arqueiro</h2>")
+    first = service.get_by_id(1)
+    assert service.get_by_id(1) is first
+    assert len(client.called) == 1
+    service.clear_cache()
+    service.get_by_id(1)
+    assert len(client.called) == 2
+
+
+def test_extract_website_matches_anchor_string():
+    html = "<p>Site oficial</p><a href='/x'>Site oficial <b>!</b></a><a href='http://s'><span>Site oficial</span></a>"
+    soup = BeautifulSoup(html, "lxml")
+    assert extract_website(soup) == get_tag_attr(soup.find("a", string="Site oficial"), "href") == "http://s"
+    assert extract_website(BeautifulSoup("<p>Site oficial</p>", "lxml")) is None
+
+
+@pytest.mark.anyio
+async def test_async_get_by_id_parses_in_executor(monkeypatch):
+    threads: list[str] = []
+    original = publishers_module.parse_publisher_page
+
+    def recording_parse(*args):
+        threads.append(threading.current_thread().name)
+        return original(*args)
+
+    monkeypatch.setattr(publishers_module, "parse_publisher_page", recording_parse)
+    service = AsyncPublisherService(cast(AsyncHTTPClient, AsyncDummyClient(DummyClient("<h2>Arqueiro</h2>"))))
+    with ThreadPoolExecutor(thread_name_prefix="parser") as executor:
+        service.parse_executor = executor
+        publisher = await service.get_by_id(1)
+    assert publisher.name == "Arqueiro"
+    assert threads and threads[0].startswith("parser")
+
+
+def render_books_page(number: int, has_next: bool) -> str:
+    pager = "<div class='proximo'></div>" if has_next else ""
+    return f"<div class='box_livro'><a href='/b{number}' title='B{number}'><img src='b.jpg'></a></div>{pager}"
+
+
+def paged_client(last_page: int) -> PagedClient:
+    return PagedClient(last_page, render_books_page)
+
+
+def test_get_all_books_follows_next_page_links():
+    client = paged_client(last_page=3)
+    service = PublisherService(cast(SyncHTTPClient, client))
+    assert [b.title for b in service.get_all_books(1)] == ["B1", "B2", "B3"]
+    assert len(client.called) == 3
+
+
+@pytest.mark.anyio
+async def test_get_all_books_runs_inside_event_loop():
+    service = PublisherService(cast(SyncHTTPClient, paged_client(last_page=2)))
+    assert [b.title for b in service.get_all_books(1)] == ["B1", "B2"]
+    assert [a.name for a in service.get_all_authors(1)] == []
+
+
+@pytest.mark.anyio
+async def test_async_get_all_books_fetches_in_windows():
+    client = AsyncDummyClient(paged_client(last_page=3))
+    service = AsyncPublisherService(cast(AsyncHTTPClient, client))
+    service.bulk_concurrency = 2
+    books = await service.get_all_books(1)
+    assert [b.title for b in books] == ["B1", "B2", "B3"]
+    assert len(client.called) == 4
+
+
+@pytest.mark.anyio
+async def test_async_iter_books_prefetches_next_page():
+    client = AsyncDummyClient(paged_client(last_page=3))
+    service = AsyncPublisherService(cast(AsyncHTTPClient, client))
+    async with aclosing(service.iter_books(1)) as books:
+        assert [b.title async for b in books] == ["B1", "B2", "B3"]
+    assert len(client.called) == 3
+
+    client.called.clear()
+    async with aclosing(service.iter_books(1)) as books:
+        first = await anext(books)
+        assert first.title == "B1"
+    assert len(client.called) <= 2
+
+
+@pytest.mark.parametrize(
+    ("followers", "rating", "male", "expected"),
+    [
+        ("1.234", "4,5 / 1.020", "30%", (1234, 4.5, 1020, 30)),
+        ("n/a", "4.5 / 20", "30", (None, 4.5, 20, 30)),
+        ("", " / ", "%", (None, None, None, None)),
+        ("12", "sem avaliações", "x%", (12, None, None, None)),
+    ],
+)
+def test_parse_stats_numbers(followers, rating, male, expected):
+    html = (
+        f"<div><span>Seguidores</span><span>{followers}</span>"
+        f"<span>Avaliações</span><span>{rating}</span>"
+        f"<i class='icon-male'></i><span>{male}</span></div>"
+    )
+    stats = parse_stats(BeautifulSoup(html, "lxml").div)
+    assert (stats.followers, stats.average_rating, stats.ratings, stats.male_percentage) == expected
@@ -0,0 +1,229 @@
+from typing import cast
+
+import pytest
+
+from pyskoob.auth import AuthService
+from pyskoob.books import BookService
+from pyskoob.http.client import SyncHTTPClient
+from pyskoob.models.enums import UsersRelation
+from pyskoob.parsers import _lxml_backend as lxml_parser
+from pyskoob.parsers import _selectolax_backend as fast_parser
+from pyskoob.users import UserService
+
+pytest.importorskip("selectolax")
+
+SEARCH_HTML = (
+    "<div class='box_lista_busca_vertical'>"
+    "<a class='capa-link-item' title='T' href='/livro/1-t-ed2.html'><img src='//img/x.jpg'></a>"
+    "<div class='detalhes-2-sub'><div><span>1234567890123</span><span>|</span><span> Pub </span></div></div>"
+    "<div class='star-mini'><strong>4,5</strong></div></div>"
+    "<div class='box_lista_busca_vertical'><a class='capa-link-item' title='U' href='/livro/3-u-ed4.html'></a></div>"
+    "<div class='contador'>45 encontrados</div>"
+)
+
+REVIEWS_HTML = (
+    "<div id='pg-livro-menu-principal-container'><a href='/livro/10-b-ed20.html'></a></div>"
+    "<div id='resenha1'><a href='/usuario/5-user'></a><star-rating rate='3'></star-rating>"
+    "<div id='resenhac1'><span>01/01/2020</span>Great<p>Really <b>great</b></p></div></div>"
+    "<div id='resenha2'><a href='/usuario/6-other'></a>"
+    "<div id='resenhac2'><span>bad</span></div></div>"
+    "<a class='proximo' href='#'></a>"
+)
+
+
+class DummyClient:
+    def __init__(self, text: str = ""):
+        self.text = text
+
+    def get(self, url: str):
+        return self
+
+    def raise_for_status(self):
+        pass
+
+
+class DummyAuth:
+    def validate_login(self):
+        pass
+
+
+def fetch_both(monkeypatch: pytest.MonkeyPatch, html: str, call, service_cls=BookService):
+    if service_cls is UserService:
+        service = UserService(cast(SyncHTTPClient, DummyClient(html)), cast(AuthService, DummyAuth()))
+    else:
+        service = service_cls(cast(SyncHTTPClient, DummyClient(html)))
+    monkeypatch.delenv(fast_parser.FAST_PARSER_ENV, raising=False)
+    slow = call(service)
+    monkeypatch.setenv(fast_parser.FAST_PARSER_ENV, "1")
+    assert fast_parser.fast_parser_enabled()
+    fast = call(service)
+    return slow, fast
+
+
+def test_search_matches_bs4(monkeypatch):
+    slow, fast = fetch_both(monkeypatch, SEARCH_HTML, lambda s: s.search("t"))
+    assert fast == slow
+    assert fast.total == 45
+    assert fast.results[0].publisher == "Pub"
+    assert fast.results[0].cover_url == "https://img/x.jpg"
+
+
+def test_reviews_match_bs4(monkeypatch):
+    slow, fast = fetch_both(monkeypatch, REVIEWS_HTML, lambda s: s.get_reviews(10))
+    assert fast == slow
+    assert fast.has_next_page is True
+    first = fast.results[0]
+    assert first.edition_id == 20
+    assert first.review_text == "Great\nReally\ngreat"
+    assert fast.results[1].reviewed_at is None
+
+
+USER_REVIEWS_HTML = (
+    "<div id='resenha1'><a href='/usuario/5-me'></a><a href='/livro/10ed20.html'></a>"
+    "<star-rating rate='4'></star-rating>"
+    "<div id='resenhac1'><span>02/02/2020</span> Nice <p>Really <b>nice</b></p><br></div></div>"
+    "<div id='resenha2'><a href='/livro/11ed21.html'></a><div id='resenhac2'><span>bad</span></div></div>"
+    "<a href='/next'> Próxima</a>"
+)
+
+USER_SEARCH_HTML = (
+    "<div style='padding: 2px; border: 1px solid #e4e4e4'><a href='/perfil'>x</a><a href='/usuario/10-john.doe'> John <b>Doe</b></a></div>"
+    "<div style='border: 0'><a href='/usuario/11-skip'>Skip</a></div>"
+    "<div class='contador'>2 encontrados</div><a class='proximo' href='#'></a>"
+)
+
+
+def test_user_reviews_match_bs4(monkeypatch):
+    slow, fast = fetch_both(monkeypatch, USER_REVIEWS_HTML, lambda s: s.get_reviews(5), UserService)
+    assert fast == slow
+    assert fast.has_next_page is True
+    assert [(r.book_id, r.edition_id, r.rating) for r in fast.results] == [(10, 20, 4.0), (11, 21, 0.0)]
+    assert fast.results[0].review_text == "Nice\nReally\nnice"
+
+
+def test_user_search_matches_bs4(monkeypatch):
+    slow, fast = fetch_both(monkeypatch, USER_SEARCH_HTML, lambda s: s.search("john"), UserService)
+    assert fast == slow
+    assert (fast.total, fast.has_next_page) == (2, True)
+    assert [(u.id, u.username, u.name) for u in fast.results] == [(10, "john.doe", "JohnDoe")]
+
+
+def test_user_relations_match_default(monkeypatch):
+    html = (
+        "<div class='usuarios-mini-lista-txt'><span><a href='/usuario/20-doe'>Doe</a></span><a href='/usuario/21-x'></a></div>"
+        "<div class='usuarios-mini-lista-txt'>no link</div>"
+        "<div class='row usuarios-mini-lista-txt'><a href='https://www.skoob.com.br/usuario/22-jane'>Jane</a></div>"
+        "<div class='proximo'></div>"
+    )
+    slow, fast = fetch_both(monkeypatch, html, lambda s: s.get_relations(10, UsersRelation.FOLLOWERS), UserService)
+    assert fast == slow
+    assert (fast.results, fast.has_next_page) == ([20, 22], True)
+
+
+RELATIONS_PAGES = [
+    "",
+    "<p>Nenhum usuário</p>",
+    "<div class='proximo'></div>",
+    "<a class='proximo' href='#'></a>",
+    "<div class='usuarios-mini-lista-txt'>no link</div>",
+    "<div class='usuarios-mini-lista-txt'><span><a href='/usuario/20-joão'>João</a></span><a href='/usuario/21-x'></a></div>",
+    "<div class='row usuarios-mini-lista-txt'><a href='https://www.skoob.com.br/usuario/22-jane'>Jane</a></div><div class='proximo'></div>",
+    "<div class='usuarios-mini-lista-txt-extra'><a href='/usuario/23-x'></a></div><div class='proximo-x'></div>",
+    "<script>'usuarios-mini-lista-txt proximo'</script><div class='usuarios-mini-lista-txt'><a href='/usuario/24'></a></div>",
+]
+USER_REVIEWS_PAGES = [
+    "",
+    "<p>Nenhuma resenha</p>",
+    USER_REVIEWS_HTML,
+    "<div id='resenha3'><a href='/livro/1ed2.html'></a><div id='resenhac3'><span>01/01/2020</span></div></div>",
+    "<div id='resenha4'><a href='/livro/1ed2.html'></a><div id='resenhac4'>Por <span>01/01/2020</span>A</div></div>",
+    "<div id='resenha5'><a href='/livro/1ed2.html'></a><star-rating rate='2.5'></star-rating></div><a><b> Próxima</b></a>",
+    "<a href='/p2'> Pr&oacute;xima</a>",
+]
+# Every parser the user service can pick, including lxml fed the undecoded body.
+RELATIONS_BACKENDS = {
+    "lxml": lambda html: lxml_parser.parse_user_relations_page(html),
+    "lxml-bytes": lambda html: lxml_parser.parse_user_relations_page(html.encode("cp1252"), "cp1252"),
+    "selectolax": fast_parser.parse_user_relations_page,
+}
+USER_REVIEWS_BACKENDS = {
+    "lxml": lambda html: lxml_parser.parse_user_reviews_page(html, 5),
+    "lxml-bytes": lambda html: lxml_parser.parse_user_reviews_page(html.encode(), 5, "utf-8"),
+    "selectolax": lambda html: fast_parser.parse_user_reviews_page(html, 5),
+}
+
+
+@pytest.mark.parametrize(
+    ("backends", "html"),
+    [(RELATIONS_BACKENDS, html) for html in RELATIONS_PAGES] + [(USER_REVIEWS_BACKENDS, html) for html in USER_REVIEWS_PAGES],
+    ids=[f"relations-{i}" for i in range(len(RELATIONS_PAGES))] + [f"reviews-{i}" for i in range(len(USER_REVIEWS_PAGES))],
+)
+def test_user_listing_backends_agree(backends, html):
+    results = {name: parse(html) for name, parse in backends.items()}
+    assert all(result == results["lxml"] for result in results.values()), results
+
+
+SCRIPT = "<script>x=1</script><style>p{}</style>"
+
+
+@pytest.mark.parametrize(
+    ("html", "call", "service_cls"),
+    [
+        (
+            f"<div id='resenha1'><a href='/usuario/5-u'></a><div id='resenhac1'><span>01/01/2020</span>Hi{SCRIPT}<p>Yo</p></div></div>",
+            lambda s: s.get_reviews(10, 20),
+            BookService,
+        ),
+        (
+            f"<div id='resenha1'><a href='/livro/1ed2.html'></a><div id='resenhac1'><span>01/01/2020</span>Hi{SCRIPT}<p>Yo</p></div></div>"
+            f"<div id='resenha2'><a href='/livro/3ed4.html'></a><div id='resenhac2'><p>{SCRIPT}</p><span>x</span>Hi{SCRIPT}</div></div>",
+            lambda s: s.get_reviews(5),
+            UserService,
+        ),
+        (
+            f"<div style='border: 1px solid #e4e4e4'><a href='/usuario/10-john'>John{SCRIPT}</a></div>"
+            f"<div class='contador'>{SCRIPT}1 encontrados</div>",
+            lambda s: s.search("john"),
+            UserService,
+        ),
+    ],
+    ids=["book-reviews", "user-reviews", "user-search"],
+)
+def test_fast_parser_skips_script_and_style_text(monkeypatch, html, call, service_cls):
+    slow, fast = fetch_both(monkeypatch, html, call, service_cls)
+    assert fast == slow
+    assert "x=1" not in repr(fast) and "p{}" not in repr(fast)
+
+
+@pytest.mark.parametrize(
+    "link",
+    [
+        "<a href='/n'> Próxima</a>",
+        "<a href='/n'><b> Próxima</b></a>",
+        "<a href='/n'> Próxima <b>»</b></a>",
+        "<a href='/n'><b> Próxima</b><!-- x --></a>",
+        "<a href='/n'> <b> Próxima</b></a>",
+    ],
+)
+def test_user_reviews_next_link_matches_lxml(link):
+    html = f"<p>x</p>{link}"
+    assert fast_parser.parse_user_reviews_page(html, 5) == lxml_parser.parse_user_reviews_page(html, 5)
+
+
+def test_fast_parser_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(fast_parser.FAST_PARSER_ENV, raising=False)
+    assert fast_parser.fast_parser_enabled() is False
+
+
+def test_readers_page_matches_bs4():
+    html = (
+        "<div class='livro-leitor-container'><a href='/usuario/7-ana'></a><a href='/usuario/99-x'></a></div>"
+        "<div class='livro-leitor-container extra'><span><a href='/usuario/8-bia'>Bia</a></span></div>"
+        "<div class='livro-leitor-container'><a href='/bad'></a></div>"
+        "<div class='livro-leitor-container'><p>no link</p></div>"
+        "<a class='btn proximo' href='/next'>next</a>"
+    )
+    assert fast_parser.parse_readers_page(html) == ([7, 8], True)
+    assert fast_parser.parse_readers_page("<div class='livro-leitor-container'><a href='/usuario/3-a'></a></div>") == ([3], False)
+    footer = "<div class='livro-leitor-container'><p>no link</p></div><footer><a href='/usuario/1-me'></a></footer>"
+    assert fast_parser.parse_readers_page(html + footer) == ([7, 8], True)
@@ -1,9 +1,11 @@
 from typing import cast
 
+from bs4 import BeautifulSoup
 from conftest import DummyClient
 
 from pyskoob.authors import AuthorService
 from pyskoob.http.client import SyncHTTPClient
+from pyskoob.parsers.authors import extract_author_stats, extract_gender_percentages
 
 
 def make_service(html: str = ""):
@@ -95,3 +97,24 @@ def test_get_books_pagination():
     assert book.book_id == 1
     assert res.total == 2
     assert res.has_next_page is True
+
+
+def test_stats_fall_back_to_following_elements():
+    html = (
+        "<div><p><img src='5_estrela.gif' alt='5'/></p><div>ignored</div><div>75%</div></div>"
+        "<p><i class='icon-male'></i></p><span>30%</span>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    assert extract_author_stats(soup).star_ratings == {"5": 75.0}
+    assert extract_gender_percentages(soup) == {"male": 30.0}
+
+
+def test_stats_pair_labels_like_find_next():
+    html = (
+        "<img src='5_estrela.gif' alt='5'/><img src='4_estrela.gif' alt='4'/><div><div>60%</div></div>"
+        "<img src='3_estrela.gif' alt='3'/><div>10%</div><img src='1_estrela.gif' alt='1'/>"
+        "<i class='icon-female'></i><i class='icon-male'></i><div><span>40%</span></div><span>60%</span>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    assert extract_author_stats(soup).star_ratings == {"5": 60.0, "4": 60.0, "3": 10.0, "1": 40.0}
+    assert extract_gender_percentages(soup) == {"male": 40.0, "female": 40.0}
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 import pytest
@@ -243,3 +245,31 @@ async def test_async_search_parsing_error() -> None:
     service = BadParsingAsyncBookService(cast(AsyncHTTPClient, DummyAsyncClient()))
     with pytest.raises(ParsingError):
         await service.search("q")
+
+
+class SearchPageAsyncClient:
+    async def get(self, url: str, **_: Any) -> DummyResponse:
+        return DummyResponse(
+            text="<div class='box_lista_busca_vertical'><a class='capa-link-item' title='B' href='/b/1-b-ed2.html'></a></div>"
+            "<div class='contador'>1 encontrados</div>"
+        )
+
+
+class ThreadRecordingBookService(AsyncBookService):
+    def __init__(self, client: AsyncHTTPClient) -> None:
+        super().__init__(client)
+        self.parse_threads: list[str] = []
+
+    def parse_html(self, content: str):  # type: ignore[override]
+        self.parse_threads.append(threading.current_thread().name)
+        return super().parse_html(content)
+
+
+@pytest.mark.anyio
+async def test_async_search_parses_in_executor() -> None:
+    service = ThreadRecordingBookService(cast(AsyncHTTPClient, SearchPageAsyncClient()))
+    with ThreadPoolExecutor(thread_name_prefix="parser") as executor:
+        service.parse_executor = executor
+        results = await service.search("b")
+    assert results.total == 1 and results.results[0].edition_id == 2
+    assert service.parse_threads and all(name.startswith("parser") for name in service.parse_threads)
@@ -1,3 +1,7 @@
+from urllib.parse import urlparse
+
+import pytest
+
 from pyskoob.utils import skoob_parser_utils as spu
 
 
@@ -20,3 +24,34 @@ def test_get_book_edition_and_user_id():
 def test_get_author_id_from_url():
     assert spu.get_author_id_from_url("https://www.skoob.com.br/autor/77-john") == "77"
     assert spu.get_author_id_from_url("https://www.skoob.com.br/autor/77-john/?ref=bar") == "77"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/livro/12345ed67890.html",
+        "livro/1ed2.html",
+        "https://www.skoob.com.br:8443/livro/12-title-ed34.html#ed99",
+        "//cdn.skoob.com.br/usuario/5-name/autor/6",
+        "https://www.skoob.com.br/usuario/7-ed8/?next=/autor/9-x",
+        "https://www2.skoob.com.br/livro/",
+        "https://ed5.skoob.com.br/usuario/autor/x",
+    ],
+)
+def test_url_helpers_only_search_the_path(url):
+    path = urlparse(url).path
+    for func in (spu.get_book_id_from_url, spu.get_book_edition_id_from_url, spu.get_user_id_from_url, spu.get_author_id_from_url):
+        try:
+            expected = func(path)
+        except ValueError:
+            with pytest.raises(ValueError):
+                func(url)
+        else:
+            assert func(url) == expected
+
+
+def test_url_helpers_ignore_digits_in_the_host():
+    with pytest.raises(ValueError):
+        spu.get_book_id_from_url("https://www2.skoob.com.br/livro/")
+    with pytest.raises(ValueError):
+        spu.get_book_edition_id_from_url("https://www.skoob.com.br/livro/1.html")
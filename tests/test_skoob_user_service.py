@@ -1,17 +1,19 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 import pytest
-from conftest import make_user
+from conftest import AsyncDummyClient, PagedClient, make_user
 
-from pyskoob.auth import AuthService
-from pyskoob.http.client import SyncHTTPClient
+from pyskoob.auth import AsyncAuthService, AuthService
+from pyskoob.http.client import AsyncHTTPClient, SyncHTTPClient
 from pyskoob.models.enums import (
     BookcaseOption,
     BrazilianState,
     UserGender,
     UsersRelation,
 )
-from pyskoob.users import UserService
+from pyskoob.users import AsyncUserService, UserService
 
 
 class DummyAuth:
@@ -83,6 +85,23 @@ def test_get_read_stats_and_bookcase():
     assert books.results[0].book_id == 1
 
 
+def test_get_bookcase_skips_entries_without_edition():
+    entry = {"ranking": None, "favorito": 0, "desejado": 0, "troco": 0, "tenho": 1, "emprestei": 0}
+    json_data = {
+        "response": [
+            {**entry, "edicao": {"livro_id": 1, "id": 2}},
+            {**entry, "edicao": None},
+            {**entry, "edicao": {"id": 3}},
+            entry,
+        ],
+        "paging": {"next_page": None},
+    }
+    service, _ = make_service(json_data=json_data)
+    books = service.get_bookcase(5, BookcaseOption.READ)
+    assert [(b.book_id, b.edition_id, b.is_owned) for b in books.results] == [(1, 2, True)]
+    assert books.total == 1
+
+
 def test_search_and_relations_and_reviews():
     html = '<div style="border: 1px solid #e4e4e4"><a href="/usuario/10-john">John</a></div><div class="contador">1 encontrados</div>'
     service, client = make_service(html=html)
@@ -131,6 +150,21 @@ def test_get_by_id_success(dummy_client: DummyClient):
     assert dummy_client.called[0].endswith("/v1/user/1/stats:true")
 
 
+def test_get_by_id_and_read_stats_are_cached_until_cleared(dummy_client: DummyClient):
+    dummy_client.json_data = {"success": True, "response": make_user().model_dump(by_alias=True)}
+    service = UserService(cast(SyncHTTPClient, dummy_client), cast(AuthService, DummyAuth()))
+    first = service.get_by_id(1)
+    assert service.get_by_id(1) is first
+    keys = ("lido", "paginas_lidas", "paginas_total", "percentual_lido", "total", "velocidade_dia", "velocidade_ideal")
+    dummy_client.json_data = {"response": {"ano": 2024, **dict.fromkeys(keys, 1)}}
+    stats = service.get_read_stats(1)
+    assert service.get_read_stats(1) is stats
+    assert len(dummy_client.called) == 2
+    service.clear_cache()
+    service.get_read_stats(1)
+    assert len(dummy_client.called) == 3
+
+
 def test_get_by_id_not_found(dummy_client: DummyClient):
     dummy_client.json_data = {"success": False}
     service = UserService(cast(SyncHTTPClient, dummy_client), cast(AuthService, DummyAuth()))
@@ -145,3 +179,94 @@ def test_get_reviews_invalid_date(dummy_client: DummyClient):
     reviews = service.get_reviews(5)
     assert reviews.results[0].reviewed_at is None
     assert reviews.results[0].review_text == "Text"
+
+
+def test_get_relations_pages_preserves_page_order():
+    html = '<div class="usuarios-mini-lista-txt"><a href="/usuario/20-doe"></a></div>'
+    service, client = make_service(html=html)
+    pages = service.get_relations_pages(10, UsersRelation.FOLLOWERS, [2, 1])
+    assert [p.page for p in pages] == [2, 1]
+    assert [p.results for p in pages] == [[20], [20]]
+    assert "page:2/" in client.called[0] and "page:1/" in client.called[1]
+
+
+class AsyncDummyAuth:
+    async def validate_login(self):
+        pass
+
+
+@pytest.mark.anyio
+async def test_async_get_reviews_pages_runs_concurrently():
+    client = AsyncDummyClient(DummyClient(text="<div id='resenha1'><a href='/livro/1ed2.html'></a></div>"))
+    service = AsyncUserService(cast(AsyncHTTPClient, client), cast(AsyncAuthService, AsyncDummyAuth()))
+    service.bulk_concurrency = 2
+    pages = await service.get_reviews_pages(5, range(1, 5))
+    assert [p.page for p in pages] == [1, 2, 3, 4]
+    assert all(p.results[0].edition_id == 2 for p in pages)
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_async_reviews_pages_parse_in_executor(monkeypatch):
+    threads: list[str] = []
+    original = AsyncUserService._parse_reviews_page
+
+    def recording_parse(self, *args):
+        threads.append(threading.current_thread().name)
+        return original(self, *args)
+
+    monkeypatch.setattr(AsyncUserService, "_parse_reviews_page", recording_parse)
+    client = AsyncDummyClient(DummyClient(text="<div id='resenha1'><a href='/livro/1ed2.html'></a></div>"))
+    service = AsyncUserService(cast(AsyncHTTPClient, client), cast(AsyncAuthService, AsyncDummyAuth()))
+    with ThreadPoolExecutor(thread_name_prefix="parser") as executor:
+        service.parse_executor = executor
+        pages = await service.get_reviews_pages(5, [1, 2])
+    assert [p.results[0].edition_id for p in pages] == [2, 2]
+    assert len(threads) == 2 and all(name.startswith("parser") for name in threads)
+
+
+class BytesResponse:
+    def __init__(self, html: str, encoding: str):
+        self.content = html.encode(encoding)
+        self.encoding = encoding
+
+    @property
+    def text(self):  # pragma: no cover - must not be used
+        raise AssertionError("reviews should be parsed from the raw body")
+
+    def raise_for_status(self):
+        pass
+
+
+def test_get_reviews_parses_undecoded_body(dummy_client: DummyClient, monkeypatch):
+    html = "<div id='resenha1'><a href='/livro/1ed2.html'></a><div id='resenhac1'><span>01/01/2020</span>Ótimo</div></div>"
+    monkeypatch.setattr(dummy_client, "get", lambda url: BytesResponse(html, "cp1252"))
+    service = UserService(cast(SyncHTTPClient, dummy_client), cast(AuthService, DummyAuth()))
+    monkeypatch.delenv("PYSKOOB_FAST_PARSER", raising=False)
+    assert service.get_reviews(5).results[0].review_text == "Ótimo"
+
+
+def render_relations_page(number: int, has_next: bool) -> str:
+    pager = '<div class="proximo"></div>' if has_next else ""
+    return f'<div class="usuarios-mini-lista-txt"><a href="/usuario/{number}-u"></a></div>{pager}'
+
+
+def test_get_all_relations_follows_next_pages():
+    client = PagedClient(3, render_relations_page)
+    service = UserService(cast(SyncHTTPClient, client), cast(AuthService, DummyAuth()))
+    assert service.get_all_relations(10, UsersRelation.FRIENDS) == [1, 2, 3]
+    assert len(client.called) == 3
+
+
+@pytest.mark.anyio
+async def test_async_get_all_relations_fetches_in_windows():
+    client = AsyncDummyClient(PagedClient(3, render_relations_page))
+    service = AsyncUserService(cast(AsyncHTTPClient, client), cast(AsyncAuthService, AsyncDummyAuth()))
+    service.bulk_concurrency = 2
+    assert await service.get_all_relations(10, UsersRelation.FRIENDS) == [1, 2, 3]
+    assert len(client.called) == 4
+
+
+def test_search_total_ignores_thousands_separators():
+    service, _ = make_service(html='<div class="contador">\n 1.234 encontrados</div>')
+    assert service.search("john").total == 1234
@@ -1,6 +1,10 @@
+import asyncio
+import warnings
+
 import pytest
 
-from pyskoob.utils.sync_async import run_sync
+from pyskoob.models.pagination import Pagination
+from pyskoob.utils.sync_async import collect_pages, gather_bounded, run_sync
 
 
 @pytest.fixture
@@ -22,3 +26,59 @@ async def test_run_sync_errors_when_loop_running(anyio_backend: str) -> None:
     with pytest.raises(RuntimeError, match=r"run_sync\(\) cannot be called"):
         run_sync(coro)
     coro.close()
+
+
+def _pages(last: int, requested: list[int], missing_after: int | None = None):
+    async def fetch(number: int) -> Pagination[int]:
+        requested.append(number)
+        if missing_after is not None and number > missing_after:
+            raise LookupError(f"page {number} does not exist")
+        results = [number] if number <= last else []
+        return Pagination(results=results, total=len(results), page=number, limit=1, has_next_page=True)
+
+    return fetch
+
+
+@pytest.mark.parametrize("window", [1, 2, 4])
+def test_collect_pages_stops_at_empty_page(window: int) -> None:
+    requested: list[int] = []
+    assert run_sync(collect_pages(_pages(3, requested), window)) == [1, 2, 3]
+    assert sorted(requested)[:4] == [1, 2, 3, 4]
+
+
+def test_collect_pages_ignores_errors_past_the_last_page() -> None:
+    requested: list[int] = []
+    assert run_sync(collect_pages(_pages(2, requested, missing_after=3), 4)) == [1, 2]
+
+
+def test_collect_pages_raises_errors_inside_the_listing() -> None:
+    with pytest.raises(LookupError, match="page 2"):
+        run_sync(collect_pages(_pages(5, [], missing_after=1), 4))
+
+
+def test_gather_bounded_cancels_pending_calls_on_failure() -> None:
+    started: list[str] = []
+    cancelled: list[str] = []
+
+    async def fail() -> None:
+        started.append("fail")
+        raise LookupError("boom")
+
+    async def hang(name: str) -> None:
+        started.append(name)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    async def main() -> None:
+        with pytest.raises(LookupError, match="boom"):
+            await gather_bounded([hang("running"), fail(), hang("queued")], 2)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        run_sync(main())
+    assert started == ["running", "fail"]
+    assert cancelled == ["running"]